@@ -1,3 +1,13 @@
+from pathlib import Path
+import sys
+
+finance_folder = next((folder for folder in Path(__file__).resolve().parents
+                       if (folder / "finance.py").exists()), None)
+if finance_folder is None:
+    raise ImportError("finance.py not found in any parent folder")
+sys.path.insert(0, str(finance_folder))
+import finance
+
 investment_amount = int(input("Enter the investment amount: "))
 while investment_amount <= 0 or investment_amount >= 50000:
         print("Invalid amount. Please enter a value greater than 0 and less than 50,000.")
@@ -10,18 +20,37 @@ investment_years = int(input("Enter the investment duration in years: "))
 while investment_years <= 0:
         print("Invalid duration. Please enter a value greater than 0.")
         investment_years = int(input("Enter the investment duration in years: "))
-months = investment_years * 12
-monthly_rate = interest_rate / 12 / 100
 total = 0
 
-for month in range(1, months + 1):
-    total += investment_amount
-    interest = round(total * monthly_rate, 2)
-    total += interest
-    if month % 12 == 0:
-        print(f"Year {month // 12}: ${round(total, 2)}")
+# Interest is rounded to cents every month, so the kernel works month by month.
+# The schedule is a generator, so each year is printed as soon as it's calculated.
+monthly_rows = finance.monthly_schedule(investment_amount, interest_rate,
+                                        investment_years, round_interest=True)
+for row in finance.yearly_schedule(monthly_rows):
+    total = row["balance"]
+    print(f"Year {row['period']}: ${round(total, 2)}")
 
 print(f"\nAfter {investment_years} years at {interest_rate}% yearly interest,")
 print(f"with a monthly investment of ${investment_amount},")
 print(f"the total investment value after compounding is ${round(total, 2)}")
+
+# Optionally export the full monthly schedule
+export_format = input("\nExport the monthly schedule? (csv/jsonl/no): ").lower().strip()
+while export_format not in ("csv", "jsonl", "no"):
+        print("Invalid choice. Please enter csv, jsonl or no.")
+        export_format = input("Export the monthly schedule? (csv/jsonl/no): ").lower().strip()
+if export_format != "no":
+        filename = f"interest_schedule.{export_format}"
+        client = {
+                "client_id": 1,
+                "monthly_investment": investment_amount,
+                "yearly_interest_rate": interest_rate,
+                "years": investment_years
+        }
+        try:
+                row_count = finance.export_client_schedules(filename, [client], export_format,
+                                                            round_interest=True)
+                print(f"{row_count} months written to '{filename}'.")
+        except IOError as e:
+                print(f"Error writing file: {e}")
 print("Written by Javier Silva")
\ No newline at end of file
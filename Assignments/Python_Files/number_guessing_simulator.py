@@ -0,0 +1,259 @@
+"""
+Module: Number Guessing Simulator
+Author: Javier Silva
+Date: 10/19/2026
+
+This program plays the guess-the-number games from random_number_test_base,
+random_number_test_advanced, random_number_test_full and the Chapter 4
+guess_the_number app without a human player. A guessing strategy (binary
+search, random, ...) plays millions of games across a pool of worker
+processes, and the program reports the win rate and how many guesses the
+wins took.
+
+Games are split into fixed-size chunks and every chunk gets its own
+random number stream seeded from the chunk number, so the same seed gives
+the same results no matter how many workers are used.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+import time
+
+# The rules of each version of the game.
+# max_attempts is None when the player can keep guessing forever, and
+# feedback is True when the player is told "too high" or "too low".
+RULESETS = {
+    "base": {"low": 0, "high": 10, "max_attempts": None, "feedback": False},
+    "advanced": {"low": 0, "high": 10, "max_attempts": 5, "feedback": False},
+    "full": {"low": 0, "high": 100, "max_attempts": 10, "feedback": True},
+    "book": {"low": 1, "high": 10, "max_attempts": None, "feedback": True},
+}
+
+# Number of games each worker task plays
+CHUNK_GAMES = 50_000
+
+# Feedback values sent to a strategy after a wrong guess
+TOO_HIGH = "high"
+TOO_LOW = "low"
+
+# --- Strategies ---
+# A strategy is a generator function strategy(low, high, rng). It yields a
+# guess, and after a wrong guess it is sent TOO_HIGH, TOO_LOW, or None when
+# the game gives no feedback.
+
+def binary_search_strategy(low, high, rng):
+    """
+    Guesses the middle of the numbers still possible. Without feedback,
+    the rest of the numbers are tried in order from low to high.
+    """
+    while True:
+        guess = (low + high) // 2
+        feedback = yield guess
+        if feedback == TOO_HIGH:
+            high = guess - 1
+        elif feedback == TOO_LOW:
+            low = guess + 1
+        else:
+            break
+
+    # No feedback, so there is nothing to halve
+    for number in range(low, high + 1):
+        if number != guess:
+            yield number
+
+def random_strategy(low, high, rng):
+    """
+    Guesses a random number that is still possible and never repeats a guess.
+    """
+    tried = set()
+    while True:
+        guess = rng.randint(low, high)
+        while guess in tried:
+            guess = rng.randint(low, high)
+        tried.add(guess)
+        feedback = yield guess
+        if feedback == TOO_HIGH:
+            high = guess - 1
+        elif feedback == TOO_LOW:
+            low = guess + 1
+
+def naive_strategy(low, high, rng):
+    """
+    Guesses a random number every time, ignoring feedback and earlier guesses.
+    """
+    while True:
+        yield rng.randint(low, high)
+
+# Strategies available to the simulator, by name
+STRATEGIES = {
+    "binary": binary_search_strategy,
+    "random": random_strategy,
+    "naive": naive_strategy,
+}
+
+def play_game(rules, strategy, rng):
+    """
+    Plays one game without any input or printing.
+
+    Args:
+        rules (dict): One of the RULESETS.
+        strategy: A strategy generator function.
+        rng (Random): The random number generator to use.
+
+    Returns:
+        int: The number of guesses it took to win, or None if the game was lost.
+    """
+    secret_number = rng.randint(rules["low"], rules["high"])
+    guesser = strategy(rules["low"], rules["high"], rng)
+    guess = next(guesser)
+    guess_count = 1
+
+    while guess != secret_number:
+        if guess_count == rules["max_attempts"]:
+            return None
+        if rules["feedback"]:
+            feedback = TOO_HIGH if guess > secret_number else TOO_LOW
+        else:
+            feedback = None
+        guess = guesser.send(feedback)
+        guess_count += 1
+    return guess_count
+
+def play_chunk(ruleset_name, strategy_name, games, seed, chunk_index):
+    """
+    Plays a chunk of games. This runs inside a worker process.
+
+    Args:
+        ruleset_name (str): Name of the rules in RULESETS.
+        strategy_name (str): Name of the strategy in STRATEGIES.
+        games (int): How many games to play.
+        seed (str): The simulation's seed.
+        chunk_index (int): Which chunk this is, used to seed its own stream.
+
+    Returns:
+        tuple: (wins_by_guess_count, losses). wins_by_guess_count is a
+        Counter of how many games were won with each number of guesses.
+    """
+    rules = RULESETS[ruleset_name]
+    strategy = STRATEGIES[strategy_name]
+    rng = Random(f"{seed}-{ruleset_name}-{strategy_name}-{chunk_index}")
+
+    wins_by_guess_count = Counter()
+    losses = 0
+    for _ in range(games):
+        guess_count = play_game(rules, strategy, rng)
+        if guess_count is None:
+            losses += 1
+        else:
+            wins_by_guess_count[guess_count] += 1
+    return wins_by_guess_count, losses
+
+def simulate(ruleset_name, strategy_name, games, seed="guess", workers=None):
+    """
+    Plays many games in parallel and combines the results.
+
+    Args:
+        ruleset_name (str): Name of the rules in RULESETS.
+        strategy_name (str): Name of the strategy in STRATEGIES.
+        games (int): Total number of games to play.
+        seed (str): Seed for reproducible results.
+        workers (int): Number of processes. Defaults to one per CPU.
+
+    Returns:
+        dict: The games played, wins, losses, win counts by number of
+        guesses, and the time taken in seconds.
+    """
+    start_time = time.perf_counter()
+    wins_by_guess_count = Counter()
+    losses = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for chunk_index, chunk_start in enumerate(range(0, games, CHUNK_GAMES)):
+            chunk_games = min(CHUNK_GAMES, games - chunk_start)
+            futures.append(executor.submit(play_chunk, ruleset_name, strategy_name,
+                                           chunk_games, seed, chunk_index))
+        for future in futures:
+            chunk_wins, chunk_losses = future.result()
+            wins_by_guess_count.update(chunk_wins)
+            losses += chunk_losses
+
+    return {
+        "games": games,
+        "wins": sum(wins_by_guess_count.values()),
+        "losses": losses,
+        "wins_by_guess_count": wins_by_guess_count,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+def display_results(ruleset_name, strategy_name, results):
+    """
+    Prints the win rate, average guesses and the guess count distribution.
+
+    Args:
+        ruleset_name (str): Name of the rules that were played.
+        strategy_name (str): Name of the strategy that played.
+        results (dict): The dictionary returned by simulate().
+    """
+    games = results["games"]
+    wins = results["wins"]
+    wins_by_guess_count = results["wins_by_guess_count"]
+
+    print(f"\n--- {strategy_name} strategy, {ruleset_name} rules ---")
+    print(f"Win rate: {wins / games:.2%} ({wins:,} of {games:,} games)")
+    if wins:
+        total_guesses = sum(count * total for count, total in wins_by_guess_count.items())
+        print(f"Average guesses per win: {total_guesses / wins:.2f}")
+        print(f"{'Guesses':<10}{'Games':>12}{'Share':>10}")
+        for guess_count in sorted(wins_by_guess_count):
+            total = wins_by_guess_count[guess_count]
+            print(f"{guess_count:<10}{total:>12,}{total / games:>10.2%}")
+    print(f"{games / results['seconds']:,.0f} games per second")
+
+def get_choice(prompt, options):
+    """
+    Prompts until the user enters one of the options.
+
+    Args:
+        prompt (str): The message to display.
+        options (list): The valid answers.
+
+    Returns:
+        str: The chosen option.
+    """
+    while True:
+        choice = input(f"{prompt} ({'/'.join(options)}): ").lower().strip()
+        if choice in options:
+            return choice
+        print("Invalid choice. Please try again.")
+
+def main():
+    """
+    Main function to run the Number Guessing Simulator.
+    """
+    print("--- Number Guessing Simulator ---")
+
+    ruleset_name = get_choice("Which rules?", list(RULESETS))
+    strategy_name = get_choice("Which strategy?", list(STRATEGIES) + ["all"])
+
+    while True:
+        try:
+            games = int(input("How many games? "))
+            if games > 0:
+                break
+            print("Invalid input. Please enter a number greater than 0.")
+        except ValueError:
+            print("Invalid input. Please enter a whole number.")
+
+    strategy_names = list(STRATEGIES) if strategy_name == "all" else [strategy_name]
+    for name in strategy_names:
+        results = simulate(ruleset_name, name, games)
+        display_results(ruleset_name, name, results)
+
+    # Final statement showing who completed the program.
+    print("\nCompleted by, Javier Silva")
+
+# This standard line runs the main function when the script is executed.
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,36 @@
 # Import the randrange function from the random library
-from random import randrange
+from random import randrange, Random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, cycle, islice
+import time
+
+# NumPy is optional. Simulations use it for speed when it is installed
+# and fall back to plain Python lists when it isn't.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Weapon values used throughout the program
+ROCK = 1
+PAPER = 2
+SCISSORS = 3
+WEAPONS = {ROCK: "Rock", PAPER: "Paper", SCISSORS: "Scissors"}
+
+# Precomputed result of every pairing, looked up as
+# OUTCOMES[user_weapon - 1][opponent_weapon - 1]:
+# 1 means the user wins, 0 is a tie and -1 means the user loses.
+OUTCOMES = (
+    (0, -1, 1),   # Rock vs Rock, Paper, Scissors
+    (1, 0, -1),   # Paper vs Rock, Paper, Scissors
+    (-1, 1, 0),   # Scissors vs Rock, Paper, Scissors
+)
+
+# Simulated rounds are generated and scored this many at a time,
+# so memory use stays the same for any number of rounds.
+# It is a multiple of 3 so the cycle strategy lines up across batches.
+BATCH_SIZE = 999_999
 
 def get_user_weapon():
     """
@@ -44,34 +75,235 @@ def determine_winner(user_weapon, opponent_weapon):
     Accepts user_weapon (int) and opponent_weapon (int) as parameters.
     Prints the outcome of the game.
     """
-    # Helper values to make the logic clearer
-    ROCK = 1
-    PAPER = 2
-    SCISSORS = 3
-
     # Display choices to the user
     # This requires converting the numbers back to strings for a user-friendly message
-    weapons = {ROCK: "Rock", PAPER: "Paper", SCISSORS: "Scissors"}
-    print(f"You chose: {weapons[user_weapon]}")
-    print(f"Opponent chose: {weapons[opponent_weapon]}")
+    print(f"You chose: {WEAPONS[user_weapon]}")
+    print(f"Opponent chose: {WEAPONS[opponent_weapon]}")
 
-    # Determine the winner
-    if user_weapon == opponent_weapon:
+    # Determine the winner with a single table lookup
+    outcome = OUTCOMES[user_weapon - 1][opponent_weapon - 1]
+    if outcome == 0:
         print("The game is a tie!\n")
-    # User win conditions
-    elif (user_weapon == ROCK and opponent_weapon == SCISSORS) or \
-         (user_weapon == SCISSORS and opponent_weapon == PAPER) or \
-         (user_weapon == PAPER and opponent_weapon == ROCK):
+    elif outcome == 1:
         print("You win!\n")
-    # If it's not a tie and the user didn't win, the opponent must have won.
     else:
         print("You lose!\n")
 
 
+# --- Headless Simulator ---
+# A strategy is a function strategy(count, rng) that returns `count`
+# weapons at once. rng is a numpy Generator when NumPy is installed,
+# otherwise a random.Random object.
+
+def draw_weapons(rng, count, weights=None):
+    """
+    Draws a batch of random weapons.
+
+    Args:
+        rng: A numpy Generator or random.Random object.
+        count (int): How many weapons to draw.
+        weights (tuple): Relative chance of Rock, Paper and Scissors.
+            Defaults to equal chances.
+
+    Returns:
+        An array (NumPy) or list of weapon values.
+    """
+    if np is not None:
+        if weights is None:
+            return rng.integers(ROCK, SCISSORS + 1, size=count, dtype=np.int8)
+        probabilities = np.array(weights) / sum(weights)
+        return rng.choice(np.array([ROCK, PAPER, SCISSORS], dtype=np.int8),
+                          size=count, p=probabilities)
+    return rng.choices((ROCK, PAPER, SCISSORS), weights=weights, k=count)
+
+def repeat_pattern(pattern, count):
+    """
+    Repeats a sequence of weapons to fill a batch.
+
+    Args:
+        pattern (tuple): The weapons to repeat in order.
+        count (int): How many weapons to return.
+
+    Returns:
+        An array (NumPy) or list of weapon values.
+    """
+    if np is not None:
+        return np.resize(np.array(pattern, dtype=np.int8), count)
+    return list(islice(cycle(pattern), count))
+
+def random_strategy(count, rng):
+    """Picks each weapon with equal chance, like get_opponent_weapon()."""
+    return draw_weapons(rng, count)
+
+def rock_strategy(count, rng):
+    """Always picks Rock."""
+    return repeat_pattern((ROCK,), count)
+
+def cycle_strategy(count, rng):
+    """Picks Rock, Paper, Scissors, Rock, ... in order."""
+    return repeat_pattern((ROCK, PAPER, SCISSORS), count)
+
+def rock_heavy_strategy(count, rng):
+    """Picks Rock half of the time and Paper or Scissors a quarter each."""
+    return draw_weapons(rng, count, weights=(2, 1, 1))
+
+# Strategies available to the simulator, by name
+STRATEGIES = {
+    "random": random_strategy,
+    "rock": rock_strategy,
+    "cycle": cycle_strategy,
+    "rock_heavy": rock_heavy_strategy,
+}
+
+def make_rng(seed):
+    """
+    Creates the random number generator strategies draw from.
+
+    Args:
+        seed (str): Any string. The same seed gives the same rounds.
+
+    Returns:
+        A numpy Generator or random.Random object.
+    """
+    if np is not None:
+        # Turn the string into a list of integers NumPy can seed from
+        return np.random.default_rng(list(seed.encode()))
+    return Random(seed)
+
+def count_outcomes(weapons_a, weapons_b):
+    """
+    Scores a batch of rounds through the OUTCOMES table.
+
+    Args:
+        weapons_a: Player A's weapons for each round.
+        weapons_b: Player B's weapons for each round.
+
+    Returns:
+        tuple: (wins, ties, losses) from player A's point of view.
+    """
+    if np is not None:
+        table = np.array(OUTCOMES, dtype=np.int8)
+        # Look up every round's result at once, then count each value
+        results = table[weapons_a - 1, weapons_b - 1]
+        wins = int(np.count_nonzero(results == 1))
+        losses = int(np.count_nonzero(results == -1))
+        return wins, len(results) - wins - losses, losses
+    
+    # Count each of the 9 possible pairings, then score the pairings
+    totals = {1: 0, 0: 0, -1: 0}
+    for (weapon_a, weapon_b), pair_count in Counter(zip(weapons_a, weapons_b)).items():
+        totals[OUTCOMES[weapon_a - 1][weapon_b - 1]] += pair_count
+    return totals[1], totals[0], totals[-1]
+
+def simulate_match(strategy_a, strategy_b, rounds, seed="rps"):
+    """
+    Plays two strategies against each other without any printing.
+
+    Args:
+        strategy_a (str): Name of player A's strategy in STRATEGIES.
+        strategy_b (str): Name of player B's strategy in STRATEGIES.
+        rounds (int): How many rounds to play.
+        seed (str): Seed for reproducible results.
+
+    Returns:
+        dict: The strategy names, round count, wins, ties and losses
+        (from player A's point of view) and the time taken in seconds.
+    """
+    # Each player gets its own random stream
+    rng_a = make_rng(f"{seed}-{strategy_a}-{strategy_b}-a")
+    rng_b = make_rng(f"{seed}-{strategy_a}-{strategy_b}-b")
+    wins = ties = losses = 0
+    
+    start_time = time.perf_counter()
+    for batch_start in range(0, rounds, BATCH_SIZE):
+        count = min(BATCH_SIZE, rounds - batch_start)
+        weapons_a = STRATEGIES[strategy_a](count, rng_a)
+        weapons_b = STRATEGIES[strategy_b](count, rng_b)
+        batch_wins, batch_ties, batch_losses = count_outcomes(weapons_a, weapons_b)
+        wins += batch_wins
+        ties += batch_ties
+        losses += batch_losses
+    
+    return {
+        "strategy_a": strategy_a,
+        "strategy_b": strategy_b,
+        "rounds": rounds,
+        "wins": wins,
+        "ties": ties,
+        "losses": losses,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+def run_tournament(strategy_names, rounds, seed="rps", workers=None):
+    """
+    Plays every pair of strategies against each other, one match per
+    worker process.
+
+    Args:
+        strategy_names (list): Names of strategies in STRATEGIES.
+        rounds (int): How many rounds each match lasts.
+        seed (str): Seed for reproducible results.
+        workers (int): Number of processes. Defaults to one per CPU.
+
+    Returns:
+        list: The result dictionary of each match.
+    """
+    matchups = list(combinations(strategy_names, 2))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(simulate_match, strategy_a, strategy_b, rounds, seed)
+                   for strategy_a, strategy_b in matchups]
+        return [future.result() for future in futures]
+
+def display_tournament(results, elapsed_seconds):
+    """
+    Prints the win/tie/loss rates of each match and the overall throughput.
+
+    Args:
+        results (list): Result dictionaries from run_tournament().
+        elapsed_seconds (float): Wall clock time for the whole tournament.
+    """
+    print(f"{'Match':<26}{'Win %':>8}{'Tie %':>8}{'Loss %':>8}")
+    print("-" * 50)
+    total_rounds = 0
+    for result in results:
+        rounds = result["rounds"]
+        total_rounds += rounds
+        match = f"{result['strategy_a']} vs {result['strategy_b']}"
+        print(f"{match:<26}{result['wins'] / rounds:>8.2%}"
+              f"{result['ties'] / rounds:>8.2%}{result['losses'] / rounds:>8.2%}")
+    print("-" * 50)
+    print(f"{total_rounds:,} rounds in {elapsed_seconds:.2f} seconds "
+          f"({total_rounds / elapsed_seconds:,.0f} rounds per second)")
+
+def run_simulation():
+    """
+    Asks for a number of rounds and runs a tournament between all strategies.
+    """
+    while True:
+        rounds_str = input("How many rounds per match? ")
+        if rounds_str.isdigit() and int(rounds_str) > 0:
+            rounds = int(rounds_str)
+            break
+        print("Invalid input. Please enter a whole number greater than 0.\n")
+    
+    backend = "NumPy" if np is not None else "pure Python"
+    print(f"\nSimulating with {backend}...")
+    start_time = time.perf_counter()
+    results = run_tournament(list(STRATEGIES), rounds)
+    display_tournament(results, time.perf_counter() - start_time)
+    print()
+
+
 def main():
     """
     The main function that controls the flow of the game.
     """
+    # Strategy testing runs headless instead of playing interactively
+    mode = input("Play a game or run a simulation? (p/s): ")
+    if mode.lower() == 's':
+        run_simulation()
+        return
+
     # Initialize the choice variable to 'y' to start the first game
     play_again = 'y'
 
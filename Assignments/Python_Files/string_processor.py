@@ -6,8 +6,26 @@ Date: 11/23/2025
 This program allows a user to search for a substring within a main string.
 If found, the user is given the option to replace that substring with a new one.
 The program demonstrates string manipulation methods, input handling, and modular design.
+
+Searching reports every occurrence, not just the first. Several patterns
+can be searched for in a single pass over the text with an Aho-Corasick
+automaton, and replacements are made by joining the pieces of the text
+once instead of calling .replace() repeatedly.
+
+Text files can be searched and edited too. Files are read in fixed-size
+chunks and the result is written to a new file, so memory use stays the
+same no matter how large the file is. Matches that cross the boundary
+between two chunks are still found.
 """
 
+from collections import deque
+
+# Number of characters read from a file at a time
+CHUNK_SIZE = 1024 * 1024
+
+# Size in bytes of the output file's write buffer
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 def get_user_input(prompt):
     """
     Prompts the user for input and returns the string.
@@ -20,30 +38,324 @@ def get_user_input(prompt):
     """
     return input(prompt)
 
+def build_automaton(patterns):
+    """
+    Builds an Aho-Corasick automaton for a list of patterns.
+
+    The automaton is a trie of the patterns plus a "failure" link for each
+    node, pointing to the longest suffix of that node's text that is also
+    in the trie. Following failure links lets the search continue without
+    ever moving backwards in the text.
+
+    Args:
+        patterns (list): The non-empty strings to search for.
+
+    Returns:
+        tuple: (goto, fail, output) lists indexed by node number.
+            goto[node] maps a character to the next node, fail[node] is the
+            failure link, and output[node] lists the pattern indexes that
+            end at that node.
+    """
+    goto = [{}]
+    fail = [0]
+    output = [[]]
+    
+    # 1. Build the trie, one pattern at a time
+    for pattern_index, pattern in enumerate(patterns):
+        node = 0
+        for char in pattern:
+            if char not in goto[node]:
+                goto.append({})
+                fail.append(0)
+                output.append([])
+                goto[node][char] = len(goto) - 1
+            node = goto[node][char]
+        output[node].append(pattern_index)
+    
+    # 2. Set failure links breadth-first, so a node's parent is done first
+    queue = deque(goto[0].values())
+    while queue:
+        node = queue.popleft()
+        for char, child in goto[node].items():
+            queue.append(child)
+            link = fail[node]
+            while link and char not in goto[link]:
+                link = fail[link]
+            fail[child] = goto[link].get(char, 0)
+            # A match at the suffix node is also a match here
+            output[child] = output[child] + output[fail[child]]
+    
+    return goto, fail, output
+
+def find_all_occurrences(main_string, patterns, automaton=None):
+    """
+    Finds every occurrence of one or more patterns in a single pass.
+
+    A single pattern is found with repeated .find() calls that each pick up
+    where the last one stopped. Several patterns are found together with an
+    Aho-Corasick automaton. Overlapping occurrences are all reported.
+
+    Args:
+        main_string (str): The string to search through.
+        patterns (list): The strings to search for. Empty strings are ignored.
+        automaton (tuple): A prebuilt automaton for the same patterns, so it
+            isn't rebuilt when searching many strings (e.g. file chunks).
+
+    Returns:
+        list: (index, pattern) tuples sorted by index, longest pattern first
+        when two start at the same index.
+    """
+    # Remove empty and duplicate patterns but keep the user's order
+    patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+    matches = []
+    
+    if len(patterns) == 1:
+        pattern = patterns[0]
+        index = main_string.find(pattern)
+        while index != -1:
+            matches.append((index, pattern))
+            index = main_string.find(pattern, index + 1)
+        return matches
+    
+    if not patterns:
+        return matches
+    
+    if automaton is None:
+        automaton = build_automaton(patterns)
+    goto, fail, output = automaton
+    node = 0
+    for position, char in enumerate(main_string):
+        # Follow failure links until the character can be matched
+        while node and char not in goto[node]:
+            node = fail[node]
+        node = goto[node].get(char, 0)
+        for pattern_index in output[node]:
+            pattern = patterns[pattern_index]
+            matches.append((position - len(pattern) + 1, pattern))
+    
+    # Matches are found in order of where they end, so sort by start
+    matches.sort(key=lambda match: (match[0], -len(match[1])))
+    return matches
+
+def select_non_overlapping(matches):
+    """
+    Picks the matches a replacement should use: scanning left to right,
+    the longest match at each position wins and overlapping ones are skipped.
+
+    Args:
+        matches (list): (index, pattern) tuples from find_all_occurrences().
+
+    Returns:
+        list: The non-overlapping (index, pattern) tuples in order.
+    """
+    selected = []
+    next_free = 0
+    for index, pattern in matches:
+        if index >= next_free:
+            selected.append((index, pattern))
+            next_free = index + len(pattern)
+    return selected
+
+def replace_matches(main_string, matches, replacements, nth=None):
+    """
+    Builds a new string with matches replaced, using a single join.
+
+    Args:
+        main_string (str): The original string.
+        matches (list): Non-overlapping (index, pattern) tuples in order.
+        replacements (dict or str): The new text for each pattern, or one
+            string used for every pattern.
+        nth (int): If given, only the nth match (starting at 1) is replaced.
+
+    Returns:
+        str: The updated string.
+    """
+    if nth is not None:
+        matches = matches[nth - 1:nth]
+    
+    pieces = []
+    last_end = 0
+    for index, pattern in matches:
+        # Keep the unchanged text between matches, then add the replacement
+        pieces.append(main_string[last_end:index])
+        if isinstance(replacements, str):
+            pieces.append(replacements)
+        else:
+            pieces.append(replacements[pattern])
+        last_end = index + len(pattern)
+    pieces.append(main_string[last_end:])
+    
+    # Strings are immutable, so the result is built once from its pieces
+    return "".join(pieces)
+
+def prepare_patterns(patterns):
+    """
+    Removes empty and duplicate patterns and builds an automaton if needed.
+
+    Args:
+        patterns (list): The strings to search for.
+
+    Returns:
+        tuple: (patterns, automaton). automaton is None for a single pattern.
+    """
+    patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+    automaton = build_automaton(patterns) if len(patterns) > 1 else None
+    return patterns, automaton
+
+def read_chunks(file, chunk_size):
+    """
+    Generator that yields a file's text one chunk at a time.
+
+    Args:
+        file: An open text file.
+        chunk_size (int): The number of characters per chunk.
+
+    Yields:
+        tuple: (chunk, is_last). is_last is True for the final chunk.
+    """
+    chunk = file.read(chunk_size)
+    while chunk:
+        next_chunk = file.read(chunk_size)
+        yield chunk, not next_chunk
+        chunk = next_chunk
+
+def search_file(input_path, patterns, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """
+    Generator that finds every occurrence of the patterns in a text file.
+
+    The last (longest pattern - 1) characters of each chunk are carried over
+    to the next one, so a match split across two chunks is still found and
+    no match is reported twice.
+
+    Args:
+        input_path (str): The file to search.
+        patterns (list): The strings to search for.
+        chunk_size (int): The number of characters read at a time.
+        encoding (str): The file's text encoding.
+
+    Yields:
+        tuple: (offset, pattern) with the character offset in the file.
+    """
+    patterns, automaton = prepare_patterns(patterns)
+    if not patterns:
+        return
+    overlap = max(len(pattern) for pattern in patterns) - 1
+    
+    # newline="" keeps line endings as they are, so offsets match the file
+    with open(input_path, "r", encoding=encoding, newline="") as file:
+        carry = ""
+        carry_offset = 0
+        for chunk, is_last in read_chunks(file, chunk_size):
+            buffer = carry + chunk
+            # Matches starting past this point may continue in the next chunk
+            safe_limit = len(buffer) if is_last else max(len(buffer) - overlap, 0)
+            for index, pattern in find_all_occurrences(buffer, patterns, automaton):
+                if index < safe_limit:
+                    yield carry_offset + index, pattern
+            carry = buffer[safe_limit:]
+            carry_offset += safe_limit
+
+def replace_in_file(input_path, output_path, replacements, chunk_size=CHUNK_SIZE,
+                    encoding="utf-8"):
+    """
+    Copies a text file to a new file with every occurrence replaced.
+
+    Only matches that start before the last (longest pattern - 1) characters
+    of a chunk are replaced right away. Those can be seen in full, so the
+    longest-match-wins rule gives the same result as for the whole file.
+    The rest of the chunk is carried over to the next one.
+
+    Args:
+        input_path (str): The file to read.
+        output_path (str): The new file to write.
+        replacements (dict): Maps each pattern to its replacement text.
+        chunk_size (int): The number of characters read at a time.
+        encoding (str): The text encoding for both files.
+
+    Returns:
+        int: The number of replacements made.
+    """
+    patterns, automaton = prepare_patterns(list(replacements))
+    overlap = max((len(pattern) for pattern in patterns), default=1) - 1
+    replaced_count = 0
+    
+    with open(input_path, "r", encoding=encoding, newline="") as input_file, \
+         open(output_path, "w", encoding=encoding, newline="",
+              buffering=WRITE_BUFFER_SIZE) as output_file:
+        carry = ""
+        for chunk, is_last in read_chunks(input_file, chunk_size):
+            buffer = carry + chunk
+            safe_limit = len(buffer) if is_last else max(len(buffer) - overlap, 0)
+            
+            matches = select_non_overlapping(
+                find_all_occurrences(buffer, patterns, automaton))
+            accepted = [match for match in matches if match[0] < safe_limit]
+            
+            # Cut after the safe point, or after the last replaced match
+            # if that one runs past it
+            cut = safe_limit
+            if accepted:
+                cut = max(cut, accepted[-1][0] + len(accepted[-1][1]))
+            
+            output_file.write(replace_matches(buffer[:cut], accepted, replacements))
+            replaced_count += len(accepted)
+            carry = buffer[cut:]
+        
+        # Anything left over (e.g. an empty pattern list) is copied unchanged
+        output_file.write(carry)
+    
+    return replaced_count
+
 def find_substring(main_string, sub_string):
     """
-    Checks if a substring exists within the main string and finds its index.
+    Finds every index where the substring occurs within the main string.
 
     Args:
         main_string (str): The string to search through.
         sub_string (str): The string to search for.
 
     Returns:
-        int: The starting index of the substring if found, otherwise -1.
-    """
-    # Check if the substring is present using the 'in' keyword
-    if sub_string in main_string:
-        # Find the index using the .find() method
-        index = main_string.find(sub_string)
-        print(f"Success! The substring '{sub_string}' was found starting at index {index}.")
-        return index
+        list: The starting index of each occurrence (empty if not found).
+    """
+    indexes = [index for index, _ in find_all_occurrences(main_string, [sub_string])]
+    
+    if indexes:
+        index_text = ", ".join(str(index) for index in indexes)
+        print(f"Success! The substring '{sub_string}' was found {len(indexes)} time(s) "
+              f"starting at index(es) {index_text}.")
     else:
         print(f"The substring '{sub_string}' was NOT found.")
-        return -1
+    return indexes
+
+def get_occurrence_choice(count):
+    """
+    Asks which occurrence to replace.
+
+    Args:
+        count (int): How many occurrences can be replaced.
+
+    Returns:
+        int: The occurrence number (starting at 1), or None for all of them.
+    """
+    if count == 1:
+        return None
+    
+    while True:
+        choice = get_user_input(f"Replace which occurrence? (1-{count} or 'all'): ").lower().strip()
+        if choice == 'all':
+            return None
+        try:
+            nth = int(choice)
+            if 1 <= nth <= count:
+                return nth
+        except ValueError:
+            pass
+        print(f"Invalid input. Please enter a number 1-{count} or 'all'.")
 
 def process_replacement(main_string, sub_string):
     """
     Asks the user if they want to replace the found substring and handles the logic.
+    The user can replace every occurrence or a single one.
 
     Args:
         main_string (str): The original string.
@@ -63,9 +375,12 @@ def process_replacement(main_string, sub_string):
         elif choice == 'yes':
             new_string = get_user_input(f"Enter the new string to replace '{sub_string}': ")
             
-            # Replace the first occurrence of the substring (Chapter 10)
-            # Note: Strings are immutable, so .replace() returns a new string.
-            updated_string = main_string.replace(sub_string, new_string, 1)
+            # Overlapping occurrences can't all be replaced, so pick the ones that can
+            matches = select_non_overlapping(find_all_occurrences(main_string, [sub_string]))
+            nth = get_occurrence_choice(len(matches))
+            
+            # Rebuild the string once with the chosen occurrence(s) replaced
+            updated_string = replace_matches(main_string, matches, new_string, nth)
             
             print(f"Updated String: {updated_string}")
             return updated_string
@@ -73,6 +388,51 @@ def process_replacement(main_string, sub_string):
         else:
             print("Invalid input. Please enter 'yes' or 'no'.")
 
+def process_file():
+    """
+    Searches a text file for a substring and optionally writes a copy
+    of the file with every occurrence replaced.
+    """
+    input_path = get_user_input("Enter the path of the file to search through: ")
+    search_text = get_user_input("Enter the substring to search for: ")
+    
+    try:
+        # Only the count is kept, so the offsets are never stored in memory
+        match_count = 0
+        for offset, _ in search_file(input_path, [search_text]):
+            if match_count == 0:
+                print(f"First occurrence found at character {offset}.")
+            match_count += 1
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading file: {e}")
+        return
+    
+    if match_count == 0:
+        print(f"The substring '{search_text}' was NOT found.")
+        return
+    print(f"Success! The substring '{search_text}' was found {match_count} time(s).")
+    
+    while True:
+        choice = get_user_input("Do you want to replace it in a new file? (yes/no): ").lower().strip()
+        
+        if choice == 'no':
+            print("No replacement was made.")
+            return
+        
+        elif choice == 'yes':
+            new_string = get_user_input(f"Enter the new string to replace '{search_text}': ")
+            output_path = get_user_input("Enter the path of the new file: ")
+            try:
+                replaced_count = replace_in_file(input_path, output_path,
+                                                 {search_text: new_string})
+                print(f"{replaced_count} replacement(s) written to '{output_path}'.")
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error processing file: {e}")
+            return
+        
+        else:
+            print("Invalid input. Please enter 'yes' or 'no'.")
+
 def main():
     """
     Main function to run the String Processor program.
@@ -81,15 +441,23 @@ def main():
     print("This tool lets you search for and optionally replace text within a string.")
     print("-" * 60) # Formatting line (repetition operator)
 
+    # File mode works on text files of any size
+    mode = get_user_input("Process a typed string or a file? (string/file): ").lower().strip()
+    if mode == 'file':
+        process_file()
+        print("-" * 60)
+        print("Thank you for using the String Processor Program.")
+        return
+
     # 1. Get Inputs
     main_text = get_user_input("Enter the main string to search through: ")
     search_text = get_user_input("Enter the substring to search for: ")
 
     # 2. Find Substring
-    index = find_substring(main_text, search_text)
+    indexes = find_substring(main_text, search_text)
 
     # 3. Process Replacement (only if found)
-    if index != -1:
+    if indexes:
         # The logic for asking and replacing is handled in this function
         final_result = process_replacement(main_text, search_text)
     
@@ -1,3 +1,175 @@
+# Import array for compact columns, bisect for the sorted GPA index and csv for bulk loading
+from array import array
+import bisect
+import csv
+import math
+import os
+
+# Global constant for the bulk load filename
+STUDENT_FILENAME = "students.csv"
+
+# --- Columnar Student Registry ---
+# For large rosters, each field is stored in its own column (a list or
+# array) instead of one dictionary per student. A student is identified by
+# their row number, which is the same in every column. A sorted GPA index
+# (gpa_keys with matching gpa_rows) answers GPA range and top-k queries
+# with binary searches instead of looping over every student.
+
+def create_registry():
+    """
+    Creates an empty columnar student registry.
+
+    Returns:
+        dict: The registry's columns, ID lookup and sorted GPA index.
+    """
+    return {
+        "names": [],
+        "ids": [],
+        "gpas": array("d"),
+        "credits": array("i"),
+        "grades": [],
+        "row_by_id": {},
+        "gpa_keys": [],
+        "gpa_rows": [],
+    }
+
+def append_row(registry, name, student_id, gpa, credits, grades):
+    """
+    Appends a student to the columns without updating the GPA index.
+    Every field is checked before any column changes, so a bad student
+    never leaves the columns with different lengths.
+
+    Returns:
+        int: The new student's row number.
+
+    Raises:
+        ValueError: If the ID is a duplicate, the GPA isn't a finite number,
+        or credits or a grade is too large for an "i" array.
+    """
+    if student_id in registry["row_by_id"]:
+        raise ValueError(f"Duplicate student ID: {student_id}")
+    # NaN can't be sorted, so it would break the binary searches
+    if not math.isfinite(gpa):
+        raise ValueError(f"GPA must be a finite number: {gpa}")
+    try:
+        credits_column = array("i", [credits])
+        grades_column = array("i", grades)
+    except OverflowError:
+        raise ValueError("Credits and grades must fit in a 32-bit integer")
+
+    row = len(registry["ids"])
+    registry["names"].append(name)
+    registry["ids"].append(student_id)
+    registry["gpas"].append(gpa)
+    registry["credits"].extend(credits_column)
+    registry["grades"].append(grades_column)
+    registry["row_by_id"][student_id] = row
+    return row
+
+def add_student(registry, name, student_id, gpa, credits, grades):
+    """
+    Adds one student to the registry and inserts them into the GPA index.
+
+    Args:
+        registry (dict): The registry from create_registry().
+        name (str): The student's name.
+        student_id (str): The student's unique ID.
+        gpa (float): The student's GPA.
+        credits (int): Credits completed.
+        grades (list): The student's grades.
+
+    Returns:
+        int: The new student's row number.
+    """
+    row = append_row(registry, name, student_id, gpa, credits, grades)
+    # Binary search for the insert position keeps the index sorted
+    position = bisect.bisect_right(registry["gpa_keys"], gpa)
+    registry["gpa_keys"].insert(position, gpa)
+    registry["gpa_rows"].insert(position, row)
+    return row
+
+def rebuild_gpa_index(registry):
+    """
+    Rebuilds the sorted GPA index from the GPA column with one sort.
+    """
+    gpas = registry["gpas"]
+    rows = sorted(range(len(gpas)), key=gpas.__getitem__)
+    registry["gpa_rows"] = rows
+    registry["gpa_keys"] = [gpas[row] for row in rows]
+
+def load_students_from_csv(registry, filename):
+    """
+    Bulk loads students from a CSV file with the columns
+    name, id, gpa, credits, grades (grades separated by spaces).
+    Damaged rows and duplicate IDs are skipped. The GPA index is rebuilt
+    once at the end instead of on every row, even if reading the file fails.
+
+    Args:
+        registry (dict): The registry from create_registry().
+        filename (str): The CSV file to read.
+
+    Returns:
+        int: The number of students loaded.
+    """
+    loaded_count = 0
+    try:
+        with open(filename, "r", newline="") as file:
+            reader = csv.reader(file)
+            for row in reader:
+                # Skip blank lines and a header row if there is one
+                if len(row) != 5 or row[2].lower() == "gpa":
+                    continue
+                name, student_id, gpa, credits, grades = row
+                try:
+                    append_row(registry, name, student_id, float(gpa), int(credits),
+                               [int(grade) for grade in grades.split()])
+                except (ValueError, OverflowError):
+                    # Skip rows with bad or too large numbers or a duplicate ID
+                    continue
+                loaded_count += 1
+    finally:
+        # Index whatever was loaded so the columns and index always match
+        rebuild_gpa_index(registry)
+    return loaded_count
+
+def get_student_record(registry, row):
+    """
+    Gathers one student's fields from every column.
+
+    Returns:
+        dict: The student's name, id, gpa, credits_completed and grades.
+    """
+    return {
+        "name": registry["names"][row],
+        "id": registry["ids"][row],
+        "gpa": registry["gpas"][row],
+        "credits_completed": registry["credits"][row],
+        "grades": list(registry["grades"][row]),
+    }
+
+def find_students_by_gpa(registry, low_gpa, high_gpa):
+    """
+    Finds the students whose GPA is between two values (inclusive).
+
+    Returns:
+        list: Row numbers of the matching students, lowest GPA first.
+    """
+    start = bisect.bisect_left(registry["gpa_keys"], low_gpa)
+    end = bisect.bisect_right(registry["gpa_keys"], high_gpa)
+    return registry["gpa_rows"][start:end]
+
+def get_top_students(registry, k):
+    """
+    Finds the k students with the highest GPA.
+
+    Returns:
+        list: Row numbers of the top students, highest GPA first.
+    """
+    if k <= 0:
+        return []
+    # The index is sorted, so the top k are the last k entries
+    return registry["gpa_rows"][-k:][::-1]
+
 def main():
     """
     Main function to manage and display student information using a dictionary.
@@ -70,7 +242,35 @@ def main():
         gpa = details.get("gpa", "N/A") # Use "N/A" as a default if GPA key is missing
         print(f"GPA for {name}: {gpa}")
 
-    # --- 6. Clear the student registry ---
+    # --- 6. Build a columnar registry for GPA queries ---
+    print("\n--- Columnar Registry GPA Queries ---")
+    registry = create_registry()
+    loaded_count = 0
+    if os.path.exists(STUDENT_FILENAME):
+        # Bulk load a full roster when a CSV file is available
+        try:
+            loaded_count = load_students_from_csv(registry, STUDENT_FILENAME)
+            print(f"Loaded {loaded_count} students from '{STUDENT_FILENAME}'.")
+        except OSError as e:
+            print(f"Error reading '{STUDENT_FILENAME}': {e}")
+            registry = create_registry()
+    if loaded_count == 0:
+        # Otherwise use the remaining students from the dictionary
+        for name, details in student_info.items():
+            add_student(registry, name, details["id"], details["gpa"],
+                        details["credits_completed"], details["grades"])
+
+    print("Students with a GPA between 3.5 and 3.9:")
+    for row in find_students_by_gpa(registry, 3.5, 3.9):
+        record = get_student_record(registry, row)
+        print(f"{record['name']}\t{record['gpa']}")
+
+    print("Top 3 students by GPA:")
+    for row in get_top_students(registry, 3):
+        record = get_student_record(registry, row)
+        print(f"{record['name']}\t{record['gpa']}")
+
+    # --- 7. Clear the student registry ---
     print("\n--- Clearing the Student Registry ---")
     # The clear() method removes all items from the dictionary.
     student_info.clear()
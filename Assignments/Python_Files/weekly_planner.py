@@ -5,15 +5,520 @@ Date: 11/29/2025
 
 This program acts as a weekly planner. It allows users to add tasks with
 due dates, view tasks specifically due in the current week (Mon-Sun),
-and list all scheduled tasks in chronological order.
+view tasks due in any month, view the next tasks coming due, and list all
+scheduled tasks in chronological order.
+
+The task list is always kept sorted by due date: new tasks are inserted
+in place with the bisect module, so listings never need to re-sort.
+Every new task is also appended to a CSV log file, and the log is loaded
+when the program starts so the planner does not start empty on every run.
+
+Recurring tasks (daily, weekly or monthly) are stored as rules, not as
+individual tasks. Their occurrences are generated lazily, only for the
+dates being viewed, and merged with one-off tasks through a heap
+(heapq.merge), so views stay fast no matter how far a rule repeats.
+
+Tasks are also kept in a week index, a dictionary that maps an
+(ISO year, ISO week) pair to the tasks due that week. Weekly and monthly
+views only look at the weeks they cover instead of scanning every task.
+
+Reminders are delivered by an asyncio scheduler that keeps upcoming due
+times in a min-heap and sleeps until the earliest one, instead of
+polling the whole task list.
 """
 
+# Import asyncio for the reminder scheduler
+import asyncio
+# Import bisect for sorted insertion and csv for the task log
+import bisect
+import calendar
+import csv
+import heapq
+import itertools
+import time
 # Import datetime and timedelta for date manipulation
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time as day_time, timedelta
+
+# Global constants for the task log and recurring rule filenames
+TASKS_FILENAME = "weekly_planner_tasks.csv"
+RECURRING_FILENAME = "weekly_planner_recurring.csv"
+
+# Supported recurrence frequencies
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+# Number of tasks shown at a time when listing all tasks
+PAGE_SIZE = 20
+
+# Reminders fire at this time of day on the due date
+REMINDER_TIME = day_time(9, 0)
+# How many days ahead to schedule reminders for
+REMINDER_DAYS = 7
+
+def get_due_date(task):
+    """
+    Returns the due date of a task. Used as the sort and bisect key.
+
+    Args:
+        task (dict): The task dictionary.
+
+    Returns:
+        date: The task's due date.
+    """
+    return task["due_date"]
+
+def get_week_key(due_date):
+    """
+    Returns the week index key for a date.
+
+    Args:
+        due_date (date): The date to look up.
+
+    Returns:
+        tuple: (ISO year, ISO week number). Using the ISO year keeps weeks
+        that span New Year's Day in a single bucket.
+    """
+    iso_year, iso_week, _ = due_date.isocalendar()
+    return (iso_year, iso_week)
+
+def index_task(week_index, task):
+    """
+    Adds a task to the bucket for the week it is due in.
+
+    Args:
+        week_index (dict): Maps (ISO year, ISO week) to a list of tasks.
+        task (dict): The task dictionary to index.
+    """
+    # setdefault creates the bucket the first time a week is used
+    week_index.setdefault(get_week_key(task["due_date"]), []).append(task)
+
+def get_tasks_in_range(week_index, start_date, end_date):
+    """
+    Finds the tasks due between two dates (inclusive) using the week index.
+    Only the weeks that overlap the range are visited, so the cost depends
+    on the size of the range, not the total number of tasks.
+
+    Args:
+        week_index (dict): Maps (ISO year, ISO week) to a list of tasks.
+        start_date (date): First day of the range.
+        end_date (date): Last day of the range.
+
+    Returns:
+        list: The matching tasks sorted by due date.
+    """
+    found_tasks = []
+    
+    # Start at the Monday of the week that contains start_date
+    monday = start_date - timedelta(days=start_date.weekday())
+    
+    while monday <= end_date:
+        for task in week_index.get(get_week_key(monday), []):
+            # The first and last weeks may only partly overlap the range
+            if start_date <= task["due_date"] <= end_date:
+                found_tasks.append(task)
+        # Stop before stepping past the last date Python can represent
+        if monday > date.max - timedelta(weeks=1):
+            break
+        monday += timedelta(weeks=1)
+    
+    # Only the matching tasks are sorted, not the whole planner
+    found_tasks.sort(key=get_due_date)
+    return found_tasks
+
+def insert_task(tasks_list, week_index, task):
+    """
+    Inserts a task into the sorted task list and the week index.
+
+    Args:
+        tasks_list (list): Task dictionaries sorted by due date.
+        week_index (dict): Maps (ISO year, ISO week) to a list of tasks.
+        task (dict): The task dictionary to insert.
+    """
+    # insort finds the position with a binary search. Inserting to the
+    # right keeps tasks with the same due date in the order they were added.
+    bisect.insort(tasks_list, task, key=get_due_date)
+    index_task(week_index, task)
+
+def save_task(task):
+    """
+    Appends a single task to the end of the task log file.
+    Only the new row is written, never the whole planner.
+
+    Args:
+        task (dict): The task dictionary to save.
+    """
+    try:
+        # Open in 'a' (append) mode, which creates the file if needed
+        with open(TASKS_FILENAME, 'a', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow([task["due_date"].isoformat(), task["name"]])
+    except IOError as e:
+        print(f"Error saving task: {e}")
+
+def load_tasks(tasks_list, week_index):
+    """
+    Reads every task from the log file into the task list and week index.
+    The list is sorted once after loading instead of on every insert.
+
+    Args:
+        tasks_list (list): The list to fill with task dictionaries.
+        week_index (dict): The week index to fill.
 
-def add_task(tasks_list):
+    Returns:
+        int: The number of tasks loaded.
     """
-    Prompts user for task details and adds them to the list.
+    loaded_tasks = []
+    try:
+        with open(TASKS_FILENAME, 'r', newline='') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                # Skip blank or damaged rows
+                if len(row) != 2:
+                    continue
+                try:
+                    # fromisoformat is much faster than strptime for YYYY-MM-DD
+                    due_date = date.fromisoformat(row[0])
+                except ValueError:
+                    continue
+                loaded_tasks.append({"name": row[1], "due_date": due_date})
+    except FileNotFoundError:
+        # No log yet, so the planner simply starts empty
+        return 0
+    except IOError as e:
+        print(f"Error reading task log: {e}")
+        return 0
+    
+    # The log is in the order tasks were added, so sort it once here
+    loaded_tasks.sort(key=get_due_date)
+    tasks_list.extend(loaded_tasks)
+    for task in loaded_tasks:
+        index_task(week_index, task)
+    return len(loaded_tasks)
+
+def get_next_due_tasks(tasks_list, count, from_date=None, recurring_rules=()):
+    """
+    Returns the next tasks coming due without sorting anything.
+
+    Args:
+        tasks_list (list): Task dictionaries sorted by due date.
+        count (int): How many tasks to return.
+        from_date (date): Earliest due date to include. Defaults to today.
+        recurring_rules (list): Recurring rules to include occurrences of.
+
+    Returns:
+        list: Up to count tasks, earliest first.
+    """
+    if from_date is None:
+        from_date = date.today()
+    # Binary search for the first task due on or after from_date
+    start = bisect.bisect_left(tasks_list, from_date, key=get_due_date)
+    if not recurring_rules:
+        return tasks_list[start:start + count]
+    
+    # Merge the one-off tasks with open-ended occurrence generators and
+    # stop as soon as enough tasks have been taken
+    one_off_tasks = tasks_list[start:start + count]
+    occurrence_streams = [generate_occurrences(rule, from_date)
+                          for rule in recurring_rules]
+    merged = heapq.merge(one_off_tasks, *occurrence_streams, key=get_due_date)
+    next_tasks = []
+    for task in merged:
+        if len(next_tasks) == count:
+            break
+        next_tasks.append(task)
+    return next_tasks
+
+def add_months(start_date, months):
+    """
+    Moves a date forward by a number of months. If the day does not exist
+    in the target month (e.g. the 31st), the last day of that month is used.
+
+    Args:
+        start_date (date): The starting date.
+        months (int): How many months to move forward.
+
+    Returns:
+        date: The shifted date.
+    """
+    month_number = start_date.month - 1 + months
+    year = start_date.year + month_number // 12
+    month = month_number % 12 + 1
+    # monthrange returns (weekday of first day, number of days in month)
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, min(start_date.day, last_day))
+
+def generate_occurrences(rule, start_date, end_date=None):
+    """
+    Lazily yields the occurrences of a recurring rule within a date range.
+    The first occurrence in the range is calculated directly, so no time
+    is spent on occurrences before start_date.
+
+    Args:
+        rule (dict): A recurring rule with "name", "start_date",
+            "frequency" and "end_date" (None if it never ends).
+        start_date (date): First day of the range.
+        end_date (date): Last day of the range, or None for no limit.
+
+    Yields:
+        dict: A task dictionary for each occurrence, in date order.
+    """
+    # The range ends at whichever comes first: the view or the rule
+    last_date = rule["end_date"]
+    if end_date is not None and (last_date is None or end_date < last_date):
+        last_date = end_date
+    
+    first_date = rule["start_date"]
+    
+    if rule["frequency"] == "monthly":
+        # Count whole months from the rule start to the range start
+        count = (start_date.year - first_date.year) * 12 + start_date.month - first_date.month
+        count = max(count, 0)
+        if add_months(first_date, count) < start_date:
+            count += 1
+        # The count of December in the last year a date can have
+        last_count = (date.max.year - first_date.year) * 12 + 12 - first_date.month
+        while count <= last_count:
+            # Always step from the rule start so a 31st doesn't drift to the 28th
+            due_date = add_months(first_date, count)
+            if last_date is not None and due_date > last_date:
+                return
+            yield {"name": rule["name"], "due_date": due_date, "recurring": True}
+            count += 1
+    else:
+        step = 1 if rule["frequency"] == "daily" else 7
+        # Ceiling division gives the first step on or after start_date
+        count = max(-(-(start_date - first_date).days // step), 0)
+        try:
+            due_date = first_date + timedelta(days=count * step)
+        except OverflowError:
+            # The first occurrence would be after the last possible date
+            return
+        while last_date is None or due_date <= last_date:
+            yield {"name": rule["name"], "due_date": due_date, "recurring": True}
+            if due_date > date.max - timedelta(days=step):
+                return
+            due_date += timedelta(days=step)
+
+def get_agenda(week_index, recurring_rules, start_date, end_date):
+    """
+    Merges the one-off tasks and recurring occurrences in a date range.
+
+    Args:
+        week_index (dict): Maps (ISO year, ISO week) to a list of tasks.
+        recurring_rules (list): The recurring rule dictionaries.
+        start_date (date): First day of the range.
+        end_date (date): Last day of the range.
+
+    Returns:
+        list: All tasks due in the range, sorted by due date.
+    """
+    one_off_tasks = get_tasks_in_range(week_index, start_date, end_date)
+    occurrence_streams = [generate_occurrences(rule, start_date, end_date)
+                          for rule in recurring_rules]
+    # Every input is already in date order, so a heap merge is enough
+    return list(heapq.merge(one_off_tasks, *occurrence_streams, key=get_due_date))
+
+def save_recurring_rule(rule):
+    """
+    Appends a recurring rule to the recurring rule file.
+
+    Args:
+        rule (dict): The recurring rule to save.
+    """
+    end_text = rule["end_date"].isoformat() if rule["end_date"] else ""
+    try:
+        with open(RECURRING_FILENAME, 'a', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow([rule["start_date"].isoformat(), rule["frequency"],
+                             end_text, rule["name"]])
+    except IOError as e:
+        print(f"Error saving recurring task: {e}")
+
+def load_recurring_rules(recurring_rules):
+    """
+    Reads every recurring rule from the recurring rule file.
+
+    Args:
+        recurring_rules (list): The list to fill with rule dictionaries.
+
+    Returns:
+        int: The number of rules loaded.
+    """
+    loaded_count = 0
+    try:
+        with open(RECURRING_FILENAME, 'r', newline='') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                # Skip blank or damaged rows
+                if len(row) != 4 or row[1] not in FREQUENCIES:
+                    continue
+                try:
+                    start_date = date.fromisoformat(row[0])
+                    end_date = date.fromisoformat(row[2]) if row[2] else None
+                except ValueError:
+                    continue
+                recurring_rules.append({
+                    "name": row[3],
+                    "start_date": start_date,
+                    "frequency": row[1],
+                    "end_date": end_date
+                })
+                loaded_count += 1
+    except FileNotFoundError:
+        return 0
+    except IOError as e:
+        print(f"Error reading recurring tasks: {e}")
+    return loaded_count
+
+class ReminderScheduler:
+    """
+    Fires callbacks at their due times using a min-heap and asyncio.
+
+    Each heap entry is a list [due_time, reminder_id, callback, args].
+    Cancelling a reminder only marks its entry as removed (lazy deletion);
+    removed entries are skipped when they reach the top of the heap.
+    Scheduling and cancelling must be done from the event loop's thread.
+    """
+
+    def __init__(self):
+        self.__heap = []
+        # Maps reminder id -> heap entry for reminders still pending
+        self.__entries = {}
+        self.__ids = itertools.count(1)
+        self.__removed_count = 0
+        # Created by run(), so it belongs to the running event loop
+        self.__wakeup = None
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def schedule(self, due_time, callback, *args):
+        """
+        Schedules callback(*args) to run at due_time.
+
+        Args:
+            due_time (float): A time.time() timestamp.
+            callback: A function or coroutine function to call.
+
+        Returns:
+            int: An id that can be passed to cancel().
+        """
+        reminder_id = next(self.__ids)
+        entry = [due_time, reminder_id, callback, args]
+        self.__entries[reminder_id] = entry
+        heapq.heappush(self.__heap, entry)
+        
+        # Wake the run loop if this reminder is now the earliest one
+        if self.__wakeup is not None and self.__heap[0] is entry:
+            self.__wakeup.set()
+        return reminder_id
+
+    def cancel(self, reminder_id):
+        """
+        Cancels a pending reminder.
+
+        Args:
+            reminder_id (int): The id returned by schedule().
+
+        Returns:
+            bool: True if the reminder was pending, otherwise False.
+        """
+        entry = self.__entries.pop(reminder_id, None)
+        if entry is None:
+            return False
+        # Mark the entry as removed instead of searching the heap for it
+        entry[2] = None
+        self.__removed_count += 1
+        
+        # Rebuild the heap once most of it is cancelled entries
+        if self.__removed_count > len(self.__heap) // 2:
+            self.__heap = [item for item in self.__heap if item[2] is not None]
+            heapq.heapify(self.__heap)
+            self.__removed_count = 0
+        return True
+
+    def __discard_removed(self):
+        """Pops cancelled entries off the top of the heap."""
+        while self.__heap and self.__heap[0][2] is None:
+            heapq.heappop(self.__heap)
+            self.__removed_count -= 1
+
+    async def run(self, stop_when_empty=True):
+        """
+        Sleeps until the earliest reminder is due, fires every reminder
+        that is due, and repeats.
+
+        Args:
+            stop_when_empty (bool): If True, return once no reminders
+                are left. If False, wait for new ones forever.
+
+        Returns:
+            int: The number of reminders fired.
+        """
+        self.__wakeup = asyncio.Event()
+        fired_count = 0
+        try:
+            while True:
+                self.__discard_removed()
+                
+                if not self.__heap:
+                    if stop_when_empty:
+                        return fired_count
+                    self.__wakeup.clear()
+                    await self.__wakeup.wait()
+                    continue
+                
+                delay = self.__heap[0][0] - time.time()
+                if delay > 0:
+                    # Sleep until the earliest due time, or until schedule()
+                    # adds an earlier reminder
+                    self.__wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self.__wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                
+                # Fire everything that is due now without sleeping in between
+                now = time.time()
+                while self.__heap and self.__heap[0][0] <= now:
+                    due_time, reminder_id, callback, args = heapq.heappop(self.__heap)
+                    if callback is None:
+                        self.__removed_count -= 1
+                        continue
+                    del self.__entries[reminder_id]
+                    result = callback(*args)
+                    if asyncio.iscoroutine(result):
+                        await result
+                    fired_count += 1
+        finally:
+            self.__wakeup = None
+
+def get_reminder_time(due_date):
+    """
+    Returns the timestamp a task's reminder should fire at.
+
+    Args:
+        due_date (date): The task's due date.
+
+    Returns:
+        float: A time.time() timestamp for REMINDER_TIME on the due date.
+    """
+    return datetime.combine(due_date, REMINDER_TIME).timestamp()
+
+def print_reminder(task):
+    """
+    Reminder callback that prints a task that has come due.
+
+    Args:
+        task (dict): The task dictionary.
+    """
+    formatted_date = task["due_date"].strftime("%B %d, %Y")
+    print(f"Reminder: '{task['name']}' is due today ({formatted_date}).")
+
+def add_task(tasks_list, week_index):
+    """
+    Prompts user for task details, adds them to the sorted list
+    and the week index, and saves them to the task log.
     Validates the date format using try-except.
     """
     print("\n--- Add New Task ---")
@@ -32,8 +537,9 @@ def add_task(tasks_list):
                 "due_date": due_date
             }
             
-            # Add to the main list
-            tasks_list.append(new_task)
+            # Add to the main list in due date order and save it
+            insert_task(tasks_list, week_index, new_task)
+            save_task(new_task)
             print(f"Task '{task_name}' added successfully for {due_date}.")
             break # Exit loop on success
             
@@ -41,7 +547,52 @@ def add_task(tasks_list):
             # Handle invalid date formats
             print("Error: Invalid date format. Please use YYYY-MM-DD.")
 
-def view_weekly_tasks(tasks_list):
+def add_recurring_task(recurring_rules):
+    """
+    Prompts user for a recurring task, saves the rule and adds it
+    to the list of recurring rules.
+    """
+    print("\n--- Add Recurring Task ---")
+    task_name = input("Enter the task name: ")
+    
+    while True:
+        frequency = input("Repeat daily, weekly or monthly? ").lower().strip()
+        if frequency in FREQUENCIES:
+            break
+        print("Error: Please enter 'daily', 'weekly' or 'monthly'.")
+    
+    while True:
+        date_str = input("Enter the first due date (YYYY-MM-DD): ")
+        try:
+            start_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            break
+        except ValueError:
+            print("Error: Invalid date format. Please use YYYY-MM-DD.")
+    
+    while True:
+        date_str = input("Enter the last date (YYYY-MM-DD), or press Enter to repeat forever: ")
+        if not date_str.strip():
+            end_date = None
+            break
+        try:
+            end_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            if end_date >= start_date:
+                break
+            print("Error: The last date cannot be before the first due date.")
+        except ValueError:
+            print("Error: Invalid date format. Please use YYYY-MM-DD.")
+    
+    new_rule = {
+        "name": task_name,
+        "start_date": start_date,
+        "frequency": frequency,
+        "end_date": end_date
+    }
+    recurring_rules.append(new_rule)
+    save_recurring_rule(new_rule)
+    print(f"Recurring task '{task_name}' added ({frequency}, starting {start_date}).")
+
+def view_weekly_tasks(week_index, recurring_rules):
     """
     Calculates the current week's range (Mon-Sun) and displays tasks
     falling within that range.
@@ -62,36 +613,125 @@ def view_weekly_tasks(tasks_list):
     
     print(f"(Current Week: {start_of_week} to {end_of_week})")
     
-    found_task = False
-    for task in tasks_list:
-        # Compare dates using comparison operators
-        if start_of_week <= task["due_date"] <= end_of_week:
-            # Format date for display
-            formatted_date = task["due_date"].strftime("%B %d, %Y")
-            print(f"- {task['name']} (Due: {formatted_date})")
-            found_task = True
+    # Only this week's bucket and occurrences are looked at
+    weekly_tasks = get_agenda(week_index, recurring_rules, start_of_week, end_of_week)
+    
+    for task in weekly_tasks:
+        # Format date for display
+        formatted_date = task["due_date"].strftime("%B %d, %Y")
+        print(f"- {task['name']} (Due: {formatted_date})")
             
-    if not found_task:
+    if not weekly_tasks:
         print("No tasks are due this week.")
 
-def list_all_tasks(tasks_list):
+def view_monthly_tasks(week_index, recurring_rules):
     """
-    Lists all tasks sorted chronologically.
+    Prompts for a month and displays the tasks due in it.
+    """
+    print("\n--- Tasks Due in a Month ---")
+    
+    while True:
+        month_str = input("Enter the month (YYYY-MM): ")
+        try:
+            first_day = datetime.strptime(month_str, "%Y-%m").date()
+            break
+        except ValueError:
+            print("Error: Invalid month format. Please use YYYY-MM.")
+    
+    # monthrange returns (weekday of first day, number of days in month)
+    last_day = first_day.replace(
+        day=calendar.monthrange(first_day.year, first_day.month)[1])
+    
+    print(f"({first_day.strftime('%B %Y')}: {first_day} to {last_day})")
+    
+    monthly_tasks = get_agenda(week_index, recurring_rules, first_day, last_day)
+    
+    for task in monthly_tasks:
+        formatted_date = task["due_date"].strftime("%B %d, %Y")
+        print(f"- {task['name']} (Due: {formatted_date})")
+    
+    if not monthly_tasks:
+        print("No tasks are due this month.")
+
+def view_next_due_tasks(tasks_list, recurring_rules):
+    """
+    Prompts for a number N and displays the next N tasks due from today.
+    """
+    print("\n--- Next Due Tasks ---")
+    
+    while True:
+        try:
+            count = int(input("How many upcoming tasks would you like to see? "))
+            if count > 0:
+                break
+            print("Error: Please enter a number greater than 0.")
+        except ValueError:
+            print("Error: Please enter a whole number.")
+    
+    next_tasks = get_next_due_tasks(tasks_list, count, recurring_rules=recurring_rules)
+    
+    for task in next_tasks:
+        formatted_date = task["due_date"].strftime("%Y-%m-%d (%A)")
+        print(f"- {formatted_date}: {task['name']}")
+    
+    if not next_tasks:
+        print("No upcoming tasks are scheduled.")
+
+def list_all_tasks(tasks_list, recurring_rules):
+    """
+    Lists the recurring rules, then all one-off tasks chronologically,
+    PAGE_SIZE tasks at a time. The list is already sorted, so it is
+    printed directly.
     """
     print("\n--- All Scheduled Tasks ---")
     
-    if not tasks_list:
+    if not tasks_list and not recurring_rules:
         print("No tasks have been scheduled yet.")
-    else:
-        # Bonus Objective: Sort tasks by due_date using lambda
-        # sorted() returns a new list, leaving the original touched or we can overwrite
-        # key=lambda x: x["due_date"] tells Python to sort based on the date value
-        sorted_tasks = sorted(tasks_list, key=lambda x: x["due_date"])
-        
-        for task in sorted_tasks:
+        return
+    
+    # Recurring tasks never run out, so only their rules are listed
+    for rule in recurring_rules:
+        until = f"until {rule['end_date']}" if rule["end_date"] else "with no end"
+        print(f"- Repeats {rule['frequency']} from {rule['start_date']} {until}: {rule['name']}")
+    
+    # Walk through the sorted list one page at a time
+    for start in range(0, len(tasks_list), PAGE_SIZE):
+        for task in tasks_list[start:start + PAGE_SIZE]:
             # Format date for display
             formatted_date = task["due_date"].strftime("%Y-%m-%d (%A)")
             print(f"- {formatted_date}: {task['name']}")
+        
+        # Ask before showing the next page (if there is one)
+        if start + PAGE_SIZE < len(tasks_list):
+            more = input("Press Enter to see more, or 'q' to stop: ").lower().strip()
+            if more == 'q':
+                break
+
+def watch_reminders(week_index, recurring_rules):
+    """
+    Schedules reminders for the tasks due in the next REMINDER_DAYS days
+    and waits for them to fire. Press Ctrl+C to stop watching.
+    """
+    print("\n--- Watching for Reminders ---")
+    
+    today = date.today()
+    upcoming_tasks = get_agenda(week_index, recurring_rules, today,
+                                today + timedelta(days=REMINDER_DAYS - 1))
+    if not upcoming_tasks:
+        print(f"No tasks are due in the next {REMINDER_DAYS} days.")
+        return
+    
+    scheduler = ReminderScheduler()
+    for task in upcoming_tasks:
+        # Reminders already in the past fire right away
+        scheduler.schedule(get_reminder_time(task["due_date"]), print_reminder, task)
+    
+    print(f"{len(scheduler)} reminder(s) scheduled. Press Ctrl+C to stop watching.")
+    try:
+        fired_count = asyncio.run(scheduler.run())
+        print(f"All {fired_count} reminder(s) delivered.")
+    except KeyboardInterrupt:
+        print("\nStopped watching for reminders.")
 
 def main():
     """
@@ -100,29 +740,54 @@ def main():
     print("Welcome to the Weekly Planner App!")
     print("Manage your schedule by adding tasks and tracking due dates.")
     
-    # Initialize empty list to store task dictionaries
+    # Initialize empty list to store task dictionaries (kept sorted by due date)
     tasks = []
+    # Initialize empty week index: (ISO year, ISO week) -> list of tasks
+    week_index = {}
+    
+    # Initialize empty list to store recurring rule dictionaries
+    recurring_rules = []
+    
+    # Load any tasks saved by earlier runs
+    loaded_count = load_tasks(tasks, week_index)
+    if loaded_count:
+        print(f"Loaded {loaded_count} saved task(s) from '{TASKS_FILENAME}'.")
+    loaded_count = load_recurring_rules(recurring_rules)
+    if loaded_count:
+        print(f"Loaded {loaded_count} recurring task(s) from '{RECURRING_FILENAME}'.")
     
     while True:
         print("\n--- Menu ---")
         print("1. Add a Task")
-        print("2. View Tasks Due This Week")
-        print("3. List All Tasks")
-        print("4. Exit")
+        print("2. Add a Recurring Task")
+        print("3. View Tasks Due This Week")
+        print("4. View Tasks Due in a Month")
+        print("5. View Next Due Tasks")
+        print("6. List All Tasks")
+        print("7. Watch for Reminders")
+        print("8. Exit")
         
-        choice = input("Enter your choice (1-4): ")
+        choice = input("Enter your choice (1-8): ")
         
         if choice == '1':
-            add_task(tasks)
+            add_task(tasks, week_index)
         elif choice == '2':
-            view_weekly_tasks(tasks)
+            add_recurring_task(recurring_rules)
         elif choice == '3':
-            list_all_tasks(tasks)
+            view_weekly_tasks(week_index, recurring_rules)
         elif choice == '4':
+            view_monthly_tasks(week_index, recurring_rules)
+        elif choice == '5':
+            view_next_due_tasks(tasks, recurring_rules)
+        elif choice == '6':
+            list_all_tasks(tasks, recurring_rules)
+        elif choice == '7':
+            watch_reminders(week_index, recurring_rules)
+        elif choice == '8':
             print("Goodbye! Stay organized.")
             break
         else:
-            print("Invalid choice. Please enter a number 1-4.")
+            print("Invalid choice. Please enter a number 1-8.")
 
 # Standard check to run the main() function
 if __name__ == "__main__":
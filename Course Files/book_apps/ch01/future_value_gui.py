@@ -3,25 +3,23 @@
 from tkinter import *
 from tkinter import ttk
 import locale
+from pathlib import Path
+import sys
+
+finance_folder = next((folder for folder in Path(__file__).resolve().parents
+                       if (folder / "finance.py").exists()), None)
+if finance_folder is None:
+    raise ImportError("finance.py not found in any parent folder")
+sys.path.insert(0, str(finance_folder))
+import finance
 
 # a function that computes the future value
 def calculate_future_value(monthly_investment,
                            yearly_interest_rate,
                            years):
 
-    # convert yearly values to monthly values
-    monthly_interest_rate = yearly_interest_rate / 12 / 100
-    months = years * 12
-
-    #calculate the future value
-    future_value = 0
-    for i in range(months):
-        future_value = future_value + monthly_investment
-        monthly_interest_amount = future_value * monthly_interest_rate
-        future_value = future_value + monthly_interest_amount
-
-    #return the future value
-    return future_value
+    # calculate the future value with the shared closed-form kernel
+    return finance.future_value(monthly_investment, yearly_interest_rate, years)
 
 # called when the Calculate button is clicked
 def on_calculate_clicked(monthly_investment_entry,
@@ -1,28 +1,66 @@
 #!/usr/bin/env python
 
-from flask import Flask, request, url_for, render_template
+# Running the app:
+#
+#   python future_value_web.py
+#       Flask's development server: one process, for development only.
+#
+#   python future_value_web.py --production [--workers 4] [--port 8000]
+#       Production mode. Uses gunicorn with several worker processes when it
+#       is installed (pip install gunicorn, Linux/macOS), otherwise waitress
+#       with several threads (pip install waitress, any OS).
+#
+#   gunicorn --workers 4 --bind 0.0.0.0:8000 future_value_web:app
+#       The same gunicorn setup run from the command line.
+#
+# load_test.py in this folder measures requests per second and latency,
+# so different configurations can be compared.
+
+from flask import (Flask, request, url_for, render_template, jsonify, make_response,
+                   Response)
+from functools import lru_cache
+import json
 import locale
+import math
+from pathlib import Path
+import sys
+
+finance_folder = next((folder for folder in Path(__file__).resolve().parents
+                       if (folder / "finance.py").exists()), None)
+if finance_folder is None:
+    raise ImportError("finance.py not found in any parent folder")
+sys.path.insert(0, str(finance_folder))
+import finance
 
 locale.setlocale(locale.LC_ALL, 'en_US')
 
 app = Flask(__name__)
 
+# let browsers reuse static files (main.css) for an hour; Flask also sends
+# an ETag and Last-Modified, so after that they only revalidate
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
+
+# most scenarios accepted by one batch request
+MAX_BATCH_SCENARIOS = 10000
+
+# most calculated pages kept in the result cache
+RESULT_CACHE_SIZE = 1024
+
+# how long browsers may reuse the index page before revalidating it
+INDEX_MAX_AGE = 300
+
+# schedule rows sent in each chunk of a streamed response
+SCHEDULE_CHUNK_ROWS = 120
+
 def calculate_future_value(monthly_investment,
                            yearly_interest_rate,
                            years):
-    monthly_interest_rate = yearly_interest_rate / 12 / 100
-    months = years * 12
-
-    future_value = 0
-    for i in range(months):
-        future_value = future_value + monthly_investment
-        monthly_interest_amount = future_value * monthly_interest_rate
-        future_value = future_value + monthly_interest_amount
-
-    return future_value
+    # closed-form calculation from the shared finance kernel
+    return finance.future_value(monthly_investment, yearly_interest_rate, years)
 
-@app.route("/")
-def show_index():
+@lru_cache(maxsize=1)
+def render_index():
+    # the empty form never changes, so it's only rendered once
     fv = {
         "monthly_investment": "",
         "yearly_interest_rate": "",
@@ -32,12 +70,19 @@ def show_index():
 
     return render_template("index.html", fv=fv)
 
-@app.route("/calculate", methods=["POST"])
-def calculate():
-    monthly_investment = float(request.form["monthly_investment"])
-    yearly_interest_rate = float(request.form["yearly_interest_rate"])
-    years = int(request.form["years"])
-    
+@app.route("/")
+def show_index():
+    response = make_response(render_index())
+    response.cache_control.public = True
+    response.cache_control.max_age = INDEX_MAX_AGE
+    response.add_etag()
+    # answers 304 Not Modified when the browser's ETag still matches
+    return response.make_conditional(request)
+
+@lru_cache(maxsize=RESULT_CACHE_SIZE)
+def render_result(monthly_investment, yearly_interest_rate, years):
+    # the calculated page for one set of inputs; repeated inputs are served
+    # from the cache without calculating or rendering anything
     future_value = locale.currency(calculate_future_value(monthly_investment,
                                                           yearly_interest_rate,
                                                           years),
@@ -51,5 +96,192 @@ def calculate():
 
     return render_template("index.html", fv=fv)
 
+@app.route("/calculate", methods=["POST"])
+def calculate():
+    # converting the form values normalizes them, so "100" and "100.0"
+    # share a cache entry
+    monthly_investment = float(request.form["monthly_investment"])
+    yearly_interest_rate = float(request.form["yearly_interest_rate"])
+    years = int(request.form["years"])
+
+    return render_result(monthly_investment, yearly_interest_rate, years)
+
+def schedule_csv_lines(rows):
+    # formats schedule rows as CSV text, one line per row
+    for row in rows:
+        row = finance.format_schedule_row(row)
+        yield ",".join(str(row[column]) for column in finance.SCHEDULE_COLUMNS) + "\n"
+
+def schedule_ndjson_lines(rows):
+    # formats schedule rows as newline-delimited JSON, one object per row
+    for row in rows:
+        yield json.dumps(finance.format_schedule_row(row)) + "\n"
+
+def chunk_lines(lines, header=""):
+    # sends the header right away so the client sees the first bytes
+    # immediately, then groups the lines so each chunk holds many rows
+    if header:
+        yield header
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == SCHEDULE_CHUNK_ROWS:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+@app.route("/api/schedule")
+def stream_schedule():
+    # streams the month-by-month schedule as CSV (default) or NDJSON; rows are
+    # generated while they are sent, so memory per request stays constant
+    scenario = {
+        "monthly_investment": request.args.get("monthly_investment", type=float),
+        "yearly_interest_rate": request.args.get("yearly_interest_rate", type=float),
+        "years": request.args.get("years", type=int),
+        }
+    values, error = parse_scenario(scenario)
+    if error is None:
+        # the balance only grows, so if the final value is finite every
+        # row is too; otherwise rows would contain inf, which isn't JSON
+        future_value, error = get_finite_future_value(values)
+    if error is not None:
+        return jsonify(error=error), 400
+
+    file_format = request.args.get("format", "csv")
+    rows = finance.monthly_schedule(*values)
+    if file_format == "csv":
+        header = ",".join(finance.SCHEDULE_COLUMNS) + "\n"
+        chunks = chunk_lines(schedule_csv_lines(rows), header)
+        mimetype = "text/csv"
+    elif file_format == "ndjson":
+        chunks = chunk_lines(schedule_ndjson_lines(rows))
+        mimetype = "application/x-ndjson"
+    else:
+        return jsonify(error="format must be csv or ndjson"), 400
+
+    # returning a generator makes Flask send a chunked response
+    return Response(chunks, mimetype=mimetype)
+
+@app.route("/api/cache")
+def show_cache_stats():
+    info = render_result.cache_info()
+    return jsonify(hits=info.hits, misses=info.misses,
+                   size=info.currsize, max_size=info.maxsize)
+
+def parse_scenario(scenario):
+    # returns (monthly_investment, yearly_interest_rate, years) and an error
+    # message, one of which is None
+    if not isinstance(scenario, dict):
+        return None, "must be an object"
+    try:
+        monthly_investment = scenario["monthly_investment"]
+        yearly_interest_rate = scenario["yearly_interest_rate"]
+        years = scenario["years"]
+    except KeyError as e:
+        return None, f"missing {e.args[0]}"
+
+    # bool is a subclass of int, so it has to be ruled out separately
+    for name, value in (("monthly_investment", monthly_investment),
+                        ("yearly_interest_rate", yearly_interest_rate)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None, f"{name} must be a number"
+        if not math.isfinite(value) or value < 0:
+            return None, f"{name} must be a number 0 or greater"
+    if isinstance(years, bool) or not isinstance(years, int):
+        return None, "years must be a whole number"
+    if not 0 <= years <= 100:
+        return None, "years must be from 0 to 100"
+
+    return (monthly_investment, yearly_interest_rate, years), None
+
+def get_finite_future_value(values):
+    # returns the future value of parsed scenario values and an error
+    # message, one of which is None. JSON has no Infinity, so results too
+    # large for a float are errors.
+    try:
+        future_value = calculate_future_value(*values)
+    except OverflowError:
+        future_value = math.inf
+    if not math.isfinite(future_value):
+        return None, "future value is too large to calculate"
+    return future_value, None
+
+@app.route("/api/calculate", methods=["POST"])
+def calculate_batch():
+    # accepts {"scenarios": [{...}, ...]} or a bare list of scenarios and
+    # returns the future values as JSON, without rendering any template
+    data = request.get_json(silent=True)
+    scenarios = data.get("scenarios") if isinstance(data, dict) else data
+    if not isinstance(scenarios, list):
+        return jsonify(error="expected a JSON list of scenarios"), 400
+    if len(scenarios) > MAX_BATCH_SCENARIOS:
+        return jsonify(error=f"at most {MAX_BATCH_SCENARIOS} scenarios per request"), 400
+
+    # calculate every scenario before responding, so a bad batch is
+    # rejected as a whole
+    results = []
+    errors = []
+    for index, scenario in enumerate(scenarios):
+        values, error = parse_scenario(scenario)
+        if error is None:
+            future_value, error = get_finite_future_value(values)
+        if error is None:
+            monthly_investment, yearly_interest_rate, years = values
+            results.append({"monthly_investment": monthly_investment,
+                            "yearly_interest_rate": yearly_interest_rate,
+                            "years": years,
+                            "future_value": round(future_value, 2)})
+        else:
+            errors.append({"index": index, "error": error})
+    if errors:
+        return jsonify(errors=errors), 400
+    return jsonify(results=results)
+
+def run_production(host, port, workers):
+    # serves the app with gunicorn worker processes, or waitress threads
+    # where gunicorn isn't available
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+
+    if BaseApplication is not None:
+        class GunicornApp(BaseApplication):
+            def load_config(self):
+                self.cfg.set("bind", f"{host}:{port}")
+                self.cfg.set("workers", workers)
+
+            def load(self):
+                return app
+
+        GunicornApp().run()
+        return
+
+    try:
+        from waitress import serve
+    except ImportError:
+        print("Production mode needs gunicorn or waitress:")
+        print("    pip install gunicorn    (Linux/macOS)")
+        print("    pip install waitress    (any OS)")
+        sys.exit(1)
+    # waitress runs in one process, so the workers become threads
+    serve(app, host=host, port=port, threads=workers)
+
 if __name__ == "__main__":
-    app.run()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the Future Value web app.")
+    parser.add_argument("--production", action="store_true",
+                        help="serve with gunicorn or waitress instead of the dev server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None,
+                        help="default: 5000 (development) or 8000 (production)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="worker processes (gunicorn) or threads (waitress)")
+    args = parser.parse_args()
+
+    if args.production:
+        run_production(args.host, args.port or 8000, args.workers)
+    else:
+        app.run(host=args.host, port=args.port or 5000)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+# Load generator for the Future Value web app.
+#
+# Sends a mix of GET /, POST /calculate and POST /api/calculate requests from
+# several threads and reports requests per second and p50/p95/p99 latency
+# for each endpoint. Examples:
+#
+#   python load_test.py --start-server            # test an in-process server
+#   python load_test.py --url http://127.0.0.1:8000 --threads 16 --duration 30
+#   python load_test.py --url http://127.0.0.1:8000 --min-rps 500
+#
+# Only successful requests count toward requests per second and latency;
+# failed ones are reported separately. The exit code is 1 when any request
+# fails (or more than --max-error-rate percent do), or when --min-rps is
+# given and throughput falls below it, so the script can catch regressions.
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# default number of scenarios in each batch request
+BATCH_SIZE = 100
+
+def make_requests(base_url, batch_size):
+    # returns (name, weight, function that builds a urllib Request) for each
+    # endpoint; the weights set how often each one is picked
+    def index_request():
+        return urllib.request.Request(base_url + "/")
+
+    def calculate_request():
+        form = {"monthly_investment": random.choice(["100", "250", "500"]),
+                "yearly_interest_rate": random.choice(["3", "5", "7.5"]),
+                "years": random.choice(["10", "20", "30"])}
+        return urllib.request.Request(base_url + "/calculate",
+                                      data=urllib.parse.urlencode(form).encode())
+
+    def batch_request():
+        scenarios = [{"monthly_investment": random.randint(50, 1000),
+                      "yearly_interest_rate": random.randint(1, 12),
+                      "years": random.randint(1, 50)}
+                     for i in range(batch_size)]
+        return urllib.request.Request(base_url + "/api/calculate",
+                                      data=json.dumps(scenarios).encode(),
+                                      headers={"Content-Type": "application/json"})
+
+    return [("GET /", 2, index_request),
+            ("POST /calculate", 5, calculate_request),
+            ("POST /api/calculate", 1, batch_request)]
+
+def run_worker(requests, stop_time, results, lock):
+    # sends requests until stop_time and records (name, seconds, ok) for each
+    names = [name for name, weight, build in requests]
+    weights = [weight for name, weight, build in requests]
+    builders = {name: build for name, weight, build in requests}
+    samples = []
+    while time.perf_counter() < stop_time:
+        name = random.choices(names, weights)[0]
+        request = builders[name]()
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                response.read()
+            ok = True
+        except (urllib.error.URLError, OSError):
+            ok = False
+        samples.append((name, time.perf_counter() - start, ok))
+    with lock:
+        results.extend(samples)
+
+def percentile(sorted_values, percent):
+    # nearest-rank percentile of an already sorted list: the smallest
+    # value with at least percent% of the values at or below it
+    index = max(0, min(len(sorted_values) - 1,
+                       math.ceil(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def report(results, elapsed):
+    # prints a table of throughput and latency per endpoint and returns
+    # (successful requests per second, error rate as a percent). Failed
+    # requests are only counted in the Errors column, since a refused
+    # connection returns quickly and would make the server look faster.
+    print(f"{'Endpoint':<22}{'OK':>10}{'Errors':>8}{'Req/s':>10}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    print("-" * 77)
+    names = sorted({name for name, seconds, ok in results})
+    for name in names + ["All"]:
+        samples = [(seconds, ok) for sample_name, seconds, ok in results
+                   if name == "All" or sample_name == name]
+        latencies = sorted(seconds * 1000 for seconds, ok in samples if ok)
+        errors = len(samples) - len(latencies)
+        if latencies:
+            latency_columns = (f"{percentile(latencies, 50):>9.2f}"
+                               f"{percentile(latencies, 95):>9.2f}"
+                               f"{percentile(latencies, 99):>9.2f}")
+        else:
+            latency_columns = f"{'-':>9}" * 3
+        print(f"{name:<22}{len(latencies):>10,}{errors:>8,}"
+              f"{len(latencies) / elapsed:>10,.1f}{latency_columns}")
+    print("-" * 77)
+
+    ok_latencies = [seconds for name, seconds, ok in results if ok]
+    if ok_latencies:
+        print(f"Mean latency: {statistics.mean(ok_latencies) * 1000:.2f} ms")
+    error_rate = (len(results) - len(ok_latencies)) / len(results) * 100
+    print(f"Error rate: {error_rate:.2f}%")
+    return len(ok_latencies) / elapsed, error_rate
+
+def start_local_server():
+    # runs the app in a background thread on a free port and returns its URL
+    import logging
+    from werkzeug.serving import make_server
+    from future_value_web import app
+
+    # don't print a log line for every request
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Future Value web app.")
+    parser.add_argument("--url", default="http://127.0.0.1:5000",
+                        help="base URL of a running app (default: %(default)s)")
+    parser.add_argument("--start-server", action="store_true",
+                        help="start the app in this process instead of using --url")
+    parser.add_argument("--threads", type=int, default=8,
+                        help="number of concurrent clients (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=10,
+                        help="seconds to run (default: %(default)s)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="scenarios per /api/calculate request (default: %(default)s)")
+    parser.add_argument("--min-rps", type=float,
+                        help="exit with status 1 if successful requests per second is lower")
+    parser.add_argument("--max-error-rate", type=float, default=0,
+                        help="exit with status 1 if more than this percent of "
+                             "requests fail (default: %(default)s)")
+    args = parser.parse_args()
+
+    base_url = start_local_server() if args.start_server else args.url.rstrip("/")
+    requests = make_requests(base_url, args.batch_size)
+
+    print(f"Testing {base_url} with {args.threads} threads for {args.duration} seconds...")
+    results = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    stop_time = start + args.duration
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        for i in range(args.threads):
+            executor.submit(run_worker, requests, stop_time, results, lock)
+    elapsed = time.perf_counter() - start
+
+    if not results:
+        print("No requests were completed.")
+        sys.exit(1)
+    requests_per_second, error_rate = report(results, elapsed)
+
+    failed = False
+    if error_rate > args.max_error_rate:
+        print(f"FAIL: {error_rate:.2f}% of requests failed (allowed: {args.max_error_rate:.2f}%)")
+        failed = True
+    if args.min_rps is not None and requests_per_second < args.min_rps:
+        print(f"FAIL: {requests_per_second:,.1f} requests/second is below {args.min_rps:,.1f}")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Tests for the JSON API of the Future Value web app. Run with:
+#
+#   python -m unittest test_future_value_web
+
+import locale
+import unittest
+
+try:
+    from future_value_web import app
+except locale.Error:
+    # the app sets the en_US locale when it's imported
+    app = None
+
+def setUpModule():
+    if app is None:
+        raise unittest.SkipTest("the en_US locale isn't installed")
+
+class CalculateBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+
+    def post(self, scenarios):
+        return self.client.post("/api/calculate", json=scenarios)
+
+    def test_calculates_every_scenario(self):
+        response = self.post([
+            {"monthly_investment": 100, "yearly_interest_rate": 5, "years": 10},
+            {"monthly_investment": 100, "yearly_interest_rate": 0, "years": 10},
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["results"]
+        self.assertEqual([result["future_value"] for result in results],
+                         [15592.93, 12000])
+
+    def test_rejects_results_too_large_for_json(self):
+        # a huge rate overflows the growth factor and a huge investment
+        # overflows the result; neither can be written as JSON
+        response = self.post([
+            {"monthly_investment": 100, "yearly_interest_rate": 5, "years": 10},
+            {"monthly_investment": 100, "yearly_interest_rate": 1000, "years": 100},
+            {"monthly_investment": 1e306, "yearly_interest_rate": 100, "years": 100},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn(b"Infinity", response.data)
+        errors = response.get_json()["errors"]
+        self.assertEqual([error["index"] for error in errors], [1, 2])
+
+    def test_rejects_invalid_input(self):
+        response = self.post([{"monthly_investment": -1,
+                               "yearly_interest_rate": 5, "years": 10}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["errors"][0]["index"], 0)
+
+class StreamScheduleTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+
+    def test_streams_every_month(self):
+        response = self.client.get("/api/schedule?monthly_investment=100"
+                                   "&yearly_interest_rate=5&years=2&format=ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data.splitlines()), 24)
+
+    def test_rejects_schedules_too_large_for_json(self):
+        for file_format in ("csv", "ndjson"):
+            response = self.client.get(
+                "/api/schedule?monthly_investment=100&yearly_interest_rate=1e306"
+                f"&years=2&format={file_format}")
+            self.assertEqual(response.status_code, 400)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,17 +2,18 @@
 
 from decimal import Decimal
 import locale as lc
+from pathlib import Path
+import sys
+
+finance_folder = next((folder for folder in Path(__file__).resolve().parents
+                       if (folder / "finance.py").exists()), None)
+if finance_folder is None:
+    raise ImportError("finance.py not found in any parent folder")
+sys.path.insert(0, str(finance_folder))
+import finance
 
 def get_future_value(monthly_investment, yearly_interest, years):
-    monthly_interest_rate = yearly_interest / 12 / 100
-    months = years * 12
-    future_value = Decimal("0.00")
-    for i in range(months):
-        future_value += monthly_investment
-        monthly_interest = future_value * monthly_interest_rate
-        future_value += monthly_interest
-    future_value = future_value.quantize(Decimal("1.00"))
-    return future_value
+    return finance.future_value_decimal(monthly_investment, yearly_interest, years)
 
 def main():
     choice = "y"
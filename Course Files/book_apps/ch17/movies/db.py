@@ -1,20 +1,144 @@
 import sqlite3
+import threading
+import weakref
 from contextlib import closing
 
 from objects import Category, Movie
 
-conn = None
+DB_FILE = "/murach/python/_db/movies.sqlite"
 
-def connect():
-    global conn
-    if not conn:
-        DB_FILE = "/murach/python/_db/movies.sqlite"
-        conn = sqlite3.connect(DB_FILE)
-        conn.row_factory = sqlite3.Row
+# seconds a connection waits for a lock before raising "database is locked"
+BUSY_TIMEOUT = 10.0
+
+# set on every new connection; WAL lets readers run while a write is in
+# progress, and NORMAL sync is safe with WAL and much faster than FULL
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,        # negative means KiB, so about 16 MB
+    "mmap_size": 268435456,      # read the file through 256 MB of mmap
+    "temp_store": "MEMORY",
+}
+
+# rows fetched from SQLite at a time by the iter_movies functions
+FETCH_SIZE = 500
+
+# movies per page for get_movies_page
+PAGE_SIZE = 20
+
+# movies inserted per transaction by add_movies
+IMPORT_BATCH_SIZE = 10000
+
+# schema changes, in order; MIGRATIONS[0] upgrades the database to
+# version 1, MIGRATIONS[1] to version 2, and so on. The database's version
+# is kept in PRAGMA user_version. Add new changes to the end of the list
+# and never edit one that has already been released.
+MIGRATIONS = [
+    # 1: indexes for get_movies_by_year and get_movies_by_category.
+    # movieID is the rowid, so each index is also sorted by movieID.
+    ["CREATE INDEX IF NOT EXISTS Movie_year ON Movie (year)",
+     "CREATE INDEX IF NOT EXISTS Movie_categoryID ON Movie (categoryID)"],
+    # 2: index for looking up movies by name
+    ["CREATE INDEX IF NOT EXISTS Movie_name ON Movie (name)"],
+]
+
+# every thread gets its own connection, since a sqlite3 connection
+# shouldn't be shared by threads running at the same time. A thread's
+# connection is closed when the thread ends, or by close().
+db_file = DB_FILE
+migrated = False  # True once db_file has been migrated
+local = threading.local()
+connections = set()
+# reentrant, because a connection can be closed by garbage collection
+# while this thread already holds the lock
+connections_lock = threading.RLock()
+
+# the Category table rarely changes, so it's read once and kept in a
+# dictionary of categoryID to Category. Call invalidate_categories() after
+# changing the table so the next lookup reads it again.
+category_cache = None
+category_cache_lock = threading.Lock()
+category_cache_stats = {"hits": 0, "misses": 0}
+
+def connect(path=None):
+    # sets the database file (if given) and opens this thread's connection
+    global db_file, migrated
+    if path and path != db_file:
+        close()
+        db_file = path
+        migrated = False
+    get_connection()
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn):
+    # applies the migrations the database doesn't have yet. Each one runs
+    # in its own transaction with the version update, so a failed
+    # migration leaves the database at the previous version.
+    while True:
+        # BEGIN IMMEDIATE takes the write lock before reading the version,
+        # so two programs can't apply the same migration
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = get_schema_version(conn)
+            if version >= len(MIGRATIONS):
+                conn.rollback()
+                return version
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+def open_connection():
+    # check_same_thread is off only so close() can close every thread's
+    # connection; each connection is still used by one thread
+    conn = sqlite3.connect(db_file, timeout=BUSY_TIMEOUT,
+                           check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for name, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+class ConnectionHolder:
+    # holds a thread's connection in the thread-local storage. When the
+    # thread ends its storage is deleted, and the finalizer set up in
+    # get_connection() closes the connection.
+    def __init__(self, conn):
+        self.conn = conn
+
+def release_connection(conn):
+    with connections_lock:
+        connections.discard(conn)
+    conn.close()
+
+def get_connection():
+    global migrated
+    holder = getattr(local, "holder", None)
+    if holder is None:
+        conn = open_connection()
+        holder = ConnectionHolder(conn)
+        weakref.finalize(holder, release_connection, conn)
+        local.holder = holder
+        with connections_lock:
+            connections.add(conn)
+            if not migrated:
+                migrate(conn)
+                migrated = True
+    return holder.conn
 
 def close():
-    if conn:
-        conn.close()
+    # closes the connections of all threads
+    global local
+    with connections_lock:
+        for conn in connections:
+            conn.close()
+        connections.clear()
+        local = threading.local()
+    invalidate_categories()
 
 def make_category(row):
     return Category(row["categoryID"], row["categoryName"])
@@ -29,65 +153,188 @@ def make_movie_list(results):
         movies.append(make_movie(row))
     return movies
 
-def get_categories():
+def iter_movies(query, params, arraysize=FETCH_SIZE):
+    # generator that yields a Movie for each row while reading the cursor,
+    # so only arraysize rows are in memory at a time
+    conn = get_connection()
+    with closing(conn.cursor()) as c:
+        c.arraysize = arraysize
+        c.execute(query, params)
+        while True:
+            rows = c.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield make_movie(row)
+
+def load_categories():
     query = '''SELECT categoryID, name as categoryName
                FROM Category'''
+    conn = get_connection()
     with closing(conn.cursor()) as c:
         c.execute(query)
         results = c.fetchall()
 
-    categories = []
+    categories = {}
     for row in results:
-        categories.append(make_category(row))
+        category = make_category(row)
+        categories[category.id] = category
     return categories
 
-def get_category(category_id):
-    query = '''SELECT categoryID, name AS categoryName
-               FROM Category WHERE categoryID = ?'''
-    with closing(conn.cursor()) as c:
-        c.execute(query, (category_id,))
-        row = c.fetchone()
-        if row:
-            return make_category(row)
+def get_category_cache():
+    # returns the cached categories, reading the table on the first call
+    # after startup or invalidate_categories()
+    global category_cache
+    with category_cache_lock:
+        if category_cache is None:
+            category_cache_stats["misses"] += 1
+            category_cache = load_categories()
         else:
-            return None
+            category_cache_stats["hits"] += 1
+        return category_cache
 
-def get_movies_by_category(category_id):
+def invalidate_categories():
+    global category_cache
+    with category_cache_lock:
+        category_cache = None
+
+def get_category_cache_stats():
+    with category_cache_lock:
+        stats = dict(category_cache_stats)
+        stats["size"] = len(category_cache) if category_cache else 0
+    return stats
+
+def get_categories():
+    return list(get_category_cache().values())
+
+def get_category(category_id):
+    return get_category_cache().get(category_id)
+
+def iter_movies_by_category(category_id, arraysize=FETCH_SIZE):
     query = '''SELECT movieID, Movie.name, year, minutes,
                       Movie.categoryID,
                       Category.name as categoryName
                FROM Movie JOIN Category
                       ON Movie.categoryID = Category.categoryID
                WHERE Movie.categoryID = ?'''
-    with closing(conn.cursor()) as c:
-        c.execute(query, (category_id,))
-        results = c.fetchall()
+    return iter_movies(query, (category_id,), arraysize)
 
-    return make_movie_list(results)
-
-def get_movies_by_year(year):
+def iter_movies_by_year(year, arraysize=FETCH_SIZE):
     query = '''SELECT movieID, Movie.name, year, minutes,
                       Movie.categoryID,
                       Category.name as categoryName
                FROM Movie JOIN Category
                       ON Movie.categoryID = Category.categoryID
                WHERE year = ?'''
-    with closing(conn.cursor()) as c:
-        c.execute(query, (year,))
-        results = c.fetchall()
+    return iter_movies(query, (year,), arraysize)
+
+def get_movies_page(column, value, after_id=None, before_id=None,
+                    page_size=PAGE_SIZE):
+    # returns one page of the movies where column equals value, sorted by
+    # movieID. Instead of OFFSET, which reads and throws away every
+    # earlier row, the page starts right after after_id (next page) or
+    # ends right before before_id (previous page), so the (column, movieID)
+    # index finds any page as quickly as the first one.
+    # Returns (movies, more), where more is True if there are more movies
+    # past this page in the direction being paged.
+    if column not in ("year", "categoryID"):
+        raise ValueError(f"Can't page movies by {column}")
+    query = f'''SELECT movieID, Movie.name, year, minutes,
+                       Movie.categoryID,
+                       Category.name as categoryName
+                FROM Movie JOIN Category
+                       ON Movie.categoryID = Category.categoryID
+                WHERE Movie.{column} = ?'''
+    params = [value]
+    if before_id is not None:
+        query += " AND movieID < ? ORDER BY movieID DESC LIMIT ?"
+        params.append(before_id)
+    else:
+        if after_id is not None:
+            query += " AND movieID > ?"
+            params.append(after_id)
+        query += " ORDER BY movieID LIMIT ?"
+    # read one extra movie to find out if there's another page
+    params.append(page_size + 1)
 
-    return make_movie_list(results)
+    movies = list(iter_movies(query, params, page_size + 1))
+    more = len(movies) > page_size
+    movies = movies[:page_size]
+    if before_id is not None:
+        movies.reverse()
+    return movies, more
+
+def get_movies_page_by_category(category_id, after_id=None, before_id=None,
+                                page_size=PAGE_SIZE):
+    return get_movies_page("categoryID", category_id, after_id, before_id,
+                           page_size)
+
+def get_movies_page_by_year(year, after_id=None, before_id=None,
+                            page_size=PAGE_SIZE):
+    return get_movies_page("year", year, after_id, before_id, page_size)
+
+def get_movies_by_category(category_id):
+    return list(iter_movies_by_category(category_id))
+
+def get_movies_by_year(year):
+    return list(iter_movies_by_year(year))
 
 def add_movie(movie):
     sql = '''INSERT INTO Movie (categoryID, name, year, minutes) 
              VALUES (?, ?, ?, ?)'''
+    conn = get_connection()
     with closing(conn.cursor()) as c:
         c.execute(sql, (movie.category.id, movie.name, movie.year,
                         movie.minutes))
         conn.commit()
 
+def insert_batch(conn, sql, batch):
+    # inserts a batch of rows in one transaction, so there is one commit
+    # for the whole batch instead of one per movie
+    conn.execute("BEGIN")
+    try:
+        with closing(conn.cursor()) as c:
+            c.executemany(sql, batch)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+def add_movies(movies, batch_size=IMPORT_BATCH_SIZE, progress=None):
+    # adds many movies, batch_size at a time. movies can be any iterable
+    # of Movie objects, including a generator reading a file. Movies with
+    # a category ID that isn't in the Category table are skipped.
+    # progress, if given, is called with (added, skipped) after each batch.
+    # Returns a tuple of (added, skipped).
+    sql = '''INSERT INTO Movie (categoryID, name, year, minutes) 
+             VALUES (?, ?, ?, ?)'''
+    category_ids = set(get_category_cache())
+    conn = get_connection()
+    added = 0
+    skipped = 0
+    batch = []
+    for movie in movies:
+        if movie.category.id not in category_ids:
+            skipped += 1
+            continue
+        batch.append((movie.category.id, movie.name, movie.year,
+                      movie.minutes))
+        if len(batch) >= batch_size:
+            insert_batch(conn, sql, batch)
+            added += len(batch)
+            batch = []
+            if progress:
+                progress(added, skipped)
+    if batch:
+        insert_batch(conn, sql, batch)
+        added += len(batch)
+        if progress:
+            progress(added, skipped)
+    return added, skipped
+
 def delete_movie(movie_id):
     sql = '''DELETE FROM Movie WHERE movieID = ?'''
+    conn = get_connection()
     with closing(conn.cursor()) as c:
         c.execute(sql, (movie_id,))
         test = conn.commit()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# Imports movies into the database from a CSV or JSON Lines file.
+#
+# A CSV file needs a header row with the columns name, year, minutes and
+# categoryID. A JSON Lines file has one object per line with the same keys.
+# Examples:
+#
+#   python import_movies.py movies.csv
+#   python import_movies.py movies.jsonl --db movies.sqlite --batch-size 50000
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+import time
+
+import db
+from objects import Category, Movie
+
+def make_movie(record):
+    name = record["name"]
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"a movie needs a name: {record}")
+    return Movie(name=name, year=int(record["year"]),
+                 minutes=int(record["minutes"]),
+                 category=Category(id=int(record["categoryID"])))
+
+def read_movies_csv(file):
+    # generator that yields a Movie for each row of a CSV file
+    for record in csv.DictReader(file):
+        yield make_movie(record)
+
+def read_movies_jsonl(file):
+    # generator that yields a Movie for each line of a JSON Lines file
+    for line in file:
+        if line.strip():
+            yield make_movie(json.loads(line))
+
+def main():
+    parser = argparse.ArgumentParser(description="Import movies from a CSV or JSON Lines file.")
+    parser.add_argument("file", help="the .csv or .jsonl file to import")
+    parser.add_argument("--db", default=db.DB_FILE,
+                        help="database file (default: %(default)s)")
+    parser.add_argument("--format", choices=["csv", "jsonl"],
+                        help="file format (default: from the file extension)")
+    parser.add_argument("--batch-size", type=int, default=db.IMPORT_BATCH_SIZE,
+                        help="movies per transaction (default: %(default)s)")
+    args = parser.parse_args()
+
+    file_format = args.format or ("jsonl" if args.file.endswith((".jsonl", ".ndjson"))
+                                  else "csv")
+    read_movies = read_movies_jsonl if file_format == "jsonl" else read_movies_csv
+
+    start = time.perf_counter()
+
+    def show_progress(added, skipped):
+        rate = added / (time.perf_counter() - start)
+        print(f"\rAdded {added:,} movies, skipped {skipped:,} "
+              f"({rate:,.0f} movies/second)", end="", flush=True)
+
+    try:
+        db.connect(args.db)
+        with open(args.file, newline="", encoding="utf-8") as file:
+            added, skipped = db.add_movies(read_movies(file), args.batch_size,
+                                           show_progress)
+    except (OSError, ValueError, KeyError, TypeError, sqlite3.Error) as e:
+        # TypeError comes from a CSV row with missing fields, which
+        # DictReader fills with None
+        print(f"\nImport stopped - {type(e).__name__}: {e}")
+        print("Movies in batches that were already added were kept.")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print()
+    print(f"{added:,} movies added and {skipped:,} skipped in "
+          f"{time.perf_counter() - start:.2f} seconds.")
+    if skipped:
+        print("Skipped movies had a category ID that isn't in the database.")
+
+if __name__ == "__main__":
+    main()
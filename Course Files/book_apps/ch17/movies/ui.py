@@ -1,5 +1,7 @@
 #!/usr/bin/env/python3
 
+import sys
+
 import db
 from objects import Movie
 
@@ -30,9 +32,13 @@ def display_movies(movies, title_term):
     print(f"{'ID':4}{'Name':38}{'Year':6}" 
           f"{'Mins':6}{'Category':10}")
     print("-" * 63)
+    # movies can be a generator, so each movie is printed as it's read
+    count = 0
     for movie in movies:
         print(f"{movie.id:<4d}{movie.name:38}{movie.year:<6d}"
               f"{movie.minutes:<6d}{movie.category.name:10}")                               
+        count += 1
+    print(f"{count} movie(s)")
     print()  
 
 def get_int(prompt):
@@ -42,6 +48,36 @@ def get_int(prompt):
         except ValueError:
             print("Invalid whole number. Please try again.\n")
 
+def display_movie_pages(get_page, title_term):
+    # shows one page of movies at a time. get_page is called with
+    # after_id or before_id and returns (movies, more) like
+    # db.get_movies_page.
+    movies, has_next = get_page()
+    has_prev = False
+    page = 1
+    while True:
+        display_movies(movies, f"{title_term} - PAGE {page}")
+        if not movies or (not has_next and not has_prev):
+            break
+
+        options = []
+        if has_next:
+            options.append("n = next")
+        if has_prev:
+            options.append("p = previous")
+        command = input(f"Page ({', '.join(options)}, Enter = done): ").lower()
+        print()
+        if command == "n" and has_next:
+            movies, has_next = get_page(after_id=movies[-1].id)
+            has_prev = True
+            page += 1
+        elif command == "p" and has_prev:
+            movies, has_prev = get_page(before_id=movies[0].id)
+            has_next = True
+            page -= 1
+        else:
+            break
+
 def display_movies_by_category():
     category_id = get_int("Category ID: ")
     category = db.get_category(category_id)
@@ -50,14 +86,15 @@ def display_movies_by_category():
         print("There is no category with that ID.\n")
     else:
         print()
-        movies = db.get_movies_by_category(category_id)
-        display_movies(movies, category.name.upper())
+        display_movie_pages(
+            lambda **keys: db.get_movies_page_by_category(category_id, **keys),
+            category.name.upper())
 
 def display_movies_by_year():
     year = get_int("Year: ")
     print()
-    movies = db.get_movies_by_year(year)
-    display_movies(movies, year)
+    display_movie_pages(
+        lambda **keys: db.get_movies_page_by_year(year, **keys), year)
 
 def add_movie():
     name        = input("Name: ")
@@ -80,7 +117,8 @@ def delete_movie():
     print(f"Movie ID {movie_id} was deleted from database.\n")
         
 def main():
-    db.connect()
+    # the database file can be given on the command line
+    db.connect(sys.argv[1] if len(sys.argv) > 1 else None)
     display_welcome()
     display_categories()
     
@@ -1,4 +1,13 @@
 from dataclasses import dataclass
+from pathlib import Path
+import sys
+
+finance_folder = next((folder for folder in Path(__file__).resolve().parents
+                       if (folder / "finance.py").exists()), None)
+if finance_folder is None:
+    raise ImportError("finance.py not found in any parent folder")
+sys.path.insert(0, str(finance_folder))
+import finance
 
 @dataclass
 class Investment():
@@ -7,13 +16,13 @@ class Investment():
     years:int = 0
 
     def calculateFutureValue(self):
-        monthlyInterestRate = self.yearlyInterestRate / 12 / 100
-        months = self.years * 12
-
-        futureValue = 0
-        for i in range(months):
-            futureValue += self.monthlyInvestment
-            monthlyInterestAmount = futureValue * monthlyInterestRate
-            futureValue += monthlyInterestAmount
+        return finance.future_value(self.monthlyInvestment,
+                                    self.yearlyInterestRate, self.years)
 
-        return futureValue
+    def getSchedule(self, yearly=False):
+        # Returns a generator, so rows are only calculated as they are used
+        rows = finance.monthly_schedule(self.monthlyInvestment,
+                                        self.yearlyInterestRate, self.years)
+        if yearly:
+            rows = finance.yearly_schedule(rows)
+        return rows
@@ -2,10 +2,22 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import locale
 
 from business import Investment
 
+# Wait this long after the last keystroke before recalculating
+DEBOUNCE_MS = 300
+# How often to check whether the worker thread has finished
+POLL_MS = 20
+# Schedule rows are added to the table this many at a time, as the user
+# scrolls near the bottom, instead of all at once
+SCHEDULE_PAGE_ROWS = 50
+# Number of schedule rows visible at once
+SCHEDULE_HEIGHT = 12
+
 class FutureValueFrame(ttk.Frame):
     def __init__(self, parent):
         ttk.Frame.__init__(self, parent, padding="10 10 10 10")
@@ -14,6 +26,15 @@ class FutureValueFrame(ttk.Frame):
 
         self.message = ""  # to hold error messages
 
+        # Calculations run on a worker thread so the window never freezes.
+        # Only the newest calculation's result is shown.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.calculationId = 0
+        self.pendingJob = None  # after() id of the debounced recalculation
+
+        # Generator of schedule rows not yet shown, or None when all are shown
+        self.scheduleRows = None
+
         # Set locale
         locale.setlocale(locale.LC_ALL, 'en_US')
 
@@ -22,6 +43,12 @@ class FutureValueFrame(ttk.Frame):
         self.yearlyInterestRate = tk.StringVar()
         self.years = tk.StringVar()
         self.futureValue = tk.StringVar()
+        self.showYearly = tk.BooleanVar()
+
+        # Recalculate as the user types
+        for variable in (self.monthlyInvestment, self.yearlyInterestRate,
+                         self.years):
+            variable.trace_add("write", self.scheduleCalculation)
 
         self.initComponents()
 
@@ -55,6 +82,34 @@ class FutureValueFrame(ttk.Frame):
         for child in self.winfo_children():
             child.grid_configure(padx=5, pady=3)
 
+        self.makeScheduleTable()
+
+    def makeScheduleTable(self):
+        # Create a frame to store the table and its scrollbar
+        scheduleFrame = ttk.Frame(self)
+        scheduleFrame.grid(column=0, row=5, columnspan=2, pady=(10, 0),
+                           sticky=tk.NSEW)
+
+        ttk.Checkbutton(scheduleFrame, text="Show by year",
+                        variable=self.showYearly,
+                        command=self.scheduleCalculation) \
+            .grid(column=0, row=0, sticky=tk.W)
+
+        columns = ("period", "contribution", "interest", "balance")
+        self.scheduleTable = ttk.Treeview(scheduleFrame, columns=columns,
+                                          show="headings",
+                                          height=SCHEDULE_HEIGHT)
+        for column in columns:
+            self.scheduleTable.heading(column, text=column.title())
+            self.scheduleTable.column(column, width=110, anchor=tk.E)
+        self.scheduleTable.column("period", width=60)
+        self.scheduleTable.grid(column=0, row=1, sticky=tk.NSEW)
+
+        self.scrollbar = ttk.Scrollbar(scheduleFrame, orient=tk.VERTICAL,
+                                       command=self.scheduleTable.yview)
+        self.scrollbar.grid(column=1, row=1, sticky=tk.NS)
+        self.scheduleTable.configure(yscrollcommand=self.scrollSchedule)
+
     def makeButtons(self):
         # Create a frame to store the two buttons
         buttonFrame = ttk.Frame(self)
@@ -65,9 +120,14 @@ class FutureValueFrame(ttk.Frame):
         # Add two buttons to the button frame
         ttk.Button(buttonFrame, text="Calculate", command=self.calculate) \
             .grid(column=0, row=0, padx=5)
-        ttk.Button(buttonFrame, text="Exit", command=self.parent.destroy) \
+        ttk.Button(buttonFrame, text="Exit", command=self.exit) \
             .grid(column=1, row=0)
 
+    def exit(self):
+        # Drop any calculation still waiting and close the window
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.parent.destroy()
+
     def get_float(self, val, fieldName):
         try:
             return float(val)
@@ -80,7 +140,18 @@ class FutureValueFrame(ttk.Frame):
         except ValueError:
             self.message += f"{fieldName} must be a valid whole number.\n"
 
-    def calculate(self):
+    def scheduleCalculation(self, *args):
+        # Restart the countdown on every keystroke, so the calculation
+        # only runs once the user pauses typing
+        if self.pendingJob is not None:
+            self.after_cancel(self.pendingJob)
+        self.pendingJob = self.after(DEBOUNCE_MS, self.calculate, False)
+
+    def calculate(self, showErrors=True):
+        # A Calculate click makes any waiting recalculation unnecessary
+        if self.pendingJob is not None:
+            self.after_cancel(self.pendingJob)
+            self.pendingJob = None
         self.message = "" # clear any previous error message 
         
         self.investment.monthlyInvestment = self.get_float(
@@ -91,13 +162,74 @@ class FutureValueFrame(ttk.Frame):
             self.years.get(), "Years")
 
         if self.message == "": # no errors
-            self.futureValue.set(locale.currency(
-                self.investment.calculateFutureValue(), grouping=True))
-        else:
+            # Give the worker its own copy so later edits can't change it
+            investment = Investment(self.investment.monthlyInvestment,
+                                    self.investment.yearlyInterestRate,
+                                    self.investment.years)
+            self.calculationId += 1
+            future = self.executor.submit(investment.calculateFutureValue)
+            self.after(POLL_MS, self.checkResult, future, self.calculationId,
+                       investment, showErrors)
+        elif showErrors:
             messagebox.showerror("Error", self.message)       
+        else:
+            # While typing, just clear the result instead of showing a dialog
+            self.calculationId += 1
+            self.futureValue.set("")
+            self.showSchedule(None)
+
+    def checkResult(self, future, calculationId, investment, showErrors):
+        # Runs on the Tk event thread, so it is safe to update the widgets
+        if not future.done():
+            self.after(POLL_MS, self.checkResult, future, calculationId,
+                       investment, showErrors)
+        elif calculationId == self.calculationId and not future.cancelled():
+            try:
+                self.futureValue.set(locale.currency(future.result(),
+                                                     grouping=True))
+                self.showSchedule(investment)
+            except (ArithmeticError, ValueError) as e:
+                self.futureValue.set("")
+                self.showSchedule(None)
+                # Only a Calculate click shows a dialog, not typing
+                if showErrors:
+                    messagebox.showerror("Error", str(e))
+
+    def showSchedule(self, investment):
+        # Clear the table and start a new schedule generator. Only the
+        # first page is added now; scrollSchedule adds the rest as needed.
+        self.scheduleTable.delete(*self.scheduleTable.get_children())
+        self.scheduleTable.heading(
+            "period", text="Year" if self.showYearly.get() else "Month")
+        if investment is None:
+            self.scheduleRows = None
+        else:
+            self.scheduleRows = investment.getSchedule(self.showYearly.get())
+            self.loadScheduleRows()
+
+    def loadScheduleRows(self):
+        if self.scheduleRows is None:
+            return
+        page = list(islice(self.scheduleRows, SCHEDULE_PAGE_ROWS))
+        for row in page:
+            self.scheduleTable.insert("", tk.END, values=(
+                row["period"],
+                locale.currency(row["contribution"], grouping=True),
+                locale.currency(row["interest"], grouping=True),
+                locale.currency(row["balance"], grouping=True)))
+        if len(page) < SCHEDULE_PAGE_ROWS:
+            self.scheduleRows = None  # every row has been shown
+
+    def scrollSchedule(self, first, last):
+        # Called by the table whenever its visible rows change
+        self.scrollbar.set(first, last)
+        # Add the next page once the user gets near the last loaded row
+        if self.scheduleRows is not None and float(last) > 0.9:
+            self.after_idle(self.loadScheduleRows)
 
 if __name__ == "__main__":
     root = tk.Tk()
     root.title("Future Value Calculator")
-    FutureValueFrame(root)
+    frame = FutureValueFrame(root)
+    root.protocol("WM_DELETE_WINDOW", frame.exit)
     root.mainloop()
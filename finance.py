@@ -0,0 +1,510 @@
+"""
+Module: Finance Kernel
+
+Shared future value calculations for the Chapter 1 GUI and web apps, the
+Chapter 9 Decimal app, the Chapter 18 GUI and interest_calculation.py. The
+console apps in Chapters 1 and 3 to 5 keep their own loops, since the loop
+is what those chapters teach.
+
+Each month the monthly investment is added and then a month of interest
+is earned on the whole balance. That is an annuity due, so the future value
+has a closed form and can be computed in O(1) instead of looping over every
+month. The month-by-month loop is kept as a reference implementation so the
+closed form can be checked against it.
+
+The Decimal version raises (1 + r) to the number of months by repeated
+squaring under a controlled decimal context with extra guard digits, so it
+takes O(log months) steps and still gives the same cents as the Decimal loop.
+
+Month-by-month schedules (contribution, interest and balance for each
+period) are produced lazily by generators, summarized by year on the fly,
+and written straight to CSV or JSON Lines files, so long schedules for
+many clients never have to be held in memory.
+
+Grids of scenarios (monthly investment x interest rate x years) are
+calculated in batches. The future value is the monthly investment times a
+growth factor that only depends on the rate and the years, so the factors
+are calculated once and every investment is a single multiplication.
+NumPy is used when it is installed, with a plain Python fallback.
+
+Running this module directly benchmarks the grid against the scalar path.
+"""
+
+import csv
+from decimal import Decimal, ROUND_FLOOR, getcontext, localcontext
+import json
+import math
+import time
+
+# NumPy is optional. Grid calculations use it when it is installed.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Approximate number of scenario rows calculated and written at a time
+GRID_CHUNK_ROWS = 1_000_000
+
+# Column headings for schedule rows
+SCHEDULE_COLUMNS = ["period", "contribution", "interest", "balance"]
+
+# Size in bytes of the write buffer used when exporting schedules
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Column headings for grid results
+GRID_COLUMNS = ["monthly_investment", "yearly_interest_rate", "years", "future_value"]
+
+def get_monthly_values(yearly_interest_rate, years):
+    """
+    Converts yearly values to monthly values.
+
+    Args:
+        yearly_interest_rate: The yearly rate as a percent (e.g. 5 for 5%).
+        years (int): The number of years.
+
+    Returns:
+        tuple: (monthly_interest_rate, months)
+    """
+    return yearly_interest_rate / 12 / 100, years * 12
+
+def future_value(monthly_investment, yearly_interest_rate, years):
+    """
+    Calculates the future value with the closed-form annuity due formula:
+    FV = P * ((1 + r)**n - 1) / r * (1 + r)
+
+    Args:
+        monthly_investment (float): The amount invested at the start of each month.
+        yearly_interest_rate (float): The yearly rate as a percent.
+        years (int): The number of years.
+
+    Returns:
+        float: The future value, unrounded like the original loop. Like the
+        loop, it is infinite when the result is too large for a float.
+    """
+    monthly_interest_rate, months = get_monthly_values(yearly_interest_rate, years)
+    if months <= 0:
+        return 0
+    if monthly_interest_rate == 0:
+        return monthly_investment * months
+    try:
+        growth = (1 + monthly_interest_rate) ** months
+    except OverflowError:
+        # The loop's balance grows past the largest float and becomes inf
+        if monthly_investment == 0:
+            return 0.0
+        return math.copysign(math.inf, monthly_investment)
+    return (monthly_investment * (growth - 1) / monthly_interest_rate
+            * (1 + monthly_interest_rate))
+
+def future_value_loop(monthly_investment, yearly_interest_rate, years):
+    """
+    Reference implementation: the month-by-month loop the apps used to run.
+    Takes O(months) time and is only meant for checking future_value().
+    """
+    monthly_interest_rate, months = get_monthly_values(yearly_interest_rate, years)
+    future_value = 0
+    for i in range(months):
+        future_value = future_value + monthly_investment
+        monthly_interest_amount = future_value * monthly_interest_rate
+        future_value = future_value + monthly_interest_amount
+    return future_value
+
+def decimal_power(base, exponent):
+    """
+    Raises a Decimal to a whole-number power by repeated squaring, using
+    O(log exponent) multiplications under the current decimal context.
+
+    Args:
+        base (Decimal): The number to raise.
+        exponent (int): The power, 0 or greater.
+
+    Returns:
+        Decimal: base ** exponent
+    """
+    result = Decimal(1)
+    while exponent > 0:
+        if exponent % 2 == 1:
+            result *= base
+        base *= base
+        exponent //= 2
+    return result
+
+def future_value_decimal(monthly_investment, yearly_interest_rate, years, precision=None):
+    """
+    Calculates the future value with Decimal values in O(log months) time,
+    rounded to cents like the Chapter 9 app.
+
+    The monthly rate is rounded to `precision` digits exactly like the loop
+    does, and the rest is calculated with extra guard digits. The loop itself
+    rounds a little every month, so when the result is close enough to half
+    a cent for that to change the cents, the reference loop is used instead.
+    Either way the result is identical to future_value_decimal_loop() at the
+    same precision.
+
+    How often that happens depends on the precision, since the loop's
+    rounding error grows with fewer digits and cannot be avoided by adding
+    guard digits here. At the default 28 digits, and at 18 or more for
+    balances up to millions, the loop is practically never needed. At 16
+    digits about 1% of calls fall back to it, at 14 digits about 20%, and
+    at 12 digits most calls do, so at low precision expect O(months) time.
+
+    Args:
+        monthly_investment (Decimal): The amount invested each month.
+        yearly_interest_rate (Decimal): The yearly rate as a percent.
+        years (int): The number of years.
+        precision (int): Significant digits, like the decimal context's
+            prec. Defaults to the current context's precision.
+
+    Returns:
+        Decimal: The future value quantized to cents.
+    """
+    if precision is None:
+        precision = getcontext().prec
+    months = years * 12
+    if months <= 0:
+        return Decimal("0.00")
+
+    with localcontext() as context:
+        context.prec = precision
+        monthly_interest_rate = yearly_interest_rate / 12 / 100
+        if monthly_interest_rate == 0:
+            return (monthly_investment * months).quantize(Decimal("1.00"))
+
+        # Guard digits cover the rounding of the log2(months) multiplications
+        context.prec = precision + len(str(months)) + 5
+        growth = decimal_power(1 + monthly_interest_rate, months)
+        future_value = (monthly_investment * (growth - 1) / monthly_interest_rate
+                        * (1 + monthly_interest_rate))
+
+        # How far past a whole cent the value is, and how far the loop's
+        # monthly rounding could have moved it (a few units in the last digit
+        # each month)
+        cents = future_value * 100
+        fraction = cents - cents.to_integral_value(rounding=ROUND_FLOOR)
+        tolerance = abs(cents) * months * Decimal(10) ** (2 - precision)
+
+    if abs(fraction - Decimal("0.5")) <= tolerance:
+        return future_value_decimal_loop(monthly_investment, yearly_interest_rate,
+                                         years, precision)
+    with localcontext() as context:
+        context.prec = precision
+        return future_value.quantize(Decimal("1.00"))
+
+def future_value_decimal_loop(monthly_investment, yearly_interest_rate, years,
+                              precision=None):
+    """
+    Reference implementation: the Chapter 9 month-by-month Decimal loop,
+    run at the given precision (defaults to the current context's).
+    """
+    with localcontext() as context:
+        if precision is not None:
+            context.prec = precision
+        monthly_interest_rate, months = get_monthly_values(yearly_interest_rate, years)
+        future_value = Decimal("0.00")
+        for i in range(months):
+            future_value += monthly_investment
+            monthly_interest = future_value * monthly_interest_rate
+            future_value += monthly_interest
+        return future_value.quantize(Decimal("1.00"))
+
+def monthly_schedule(monthly_investment, yearly_interest_rate, years,
+                     round_interest=False):
+    """
+    Generator that lazily yields one row per month of an investment.
+
+    Args:
+        monthly_investment (float): The amount invested each month.
+        yearly_interest_rate (float): The yearly rate as a percent.
+        years (int): The number of years.
+        round_interest (bool): Round each month's interest to cents, like
+            interest_calculation.py. Rounding every month changes each later
+            month's interest, so these balances can only be calculated in order.
+
+    Yields:
+        dict: A row with the SCHEDULE_COLUMNS keys. "period" is the month number.
+    """
+    monthly_interest_rate, months = get_monthly_values(yearly_interest_rate, years)
+    balance = 0
+    for month in range(1, months + 1):
+        balance += monthly_investment
+        interest = balance * monthly_interest_rate
+        if round_interest:
+            interest = round(interest, 2)
+        balance += interest
+        yield {
+            "period": month,
+            "contribution": monthly_investment,
+            "interest": interest,
+            "balance": balance,
+        }
+
+def yearly_schedule(monthly_rows):
+    """
+    Generator that combines monthly rows into one row per year.
+
+    Args:
+        monthly_rows: Rows from monthly_schedule().
+
+    Yields:
+        dict: A row with the SCHEDULE_COLUMNS keys. "period" is the year
+        number, contribution and interest are totals for the year, and
+        balance is the balance at the end of the year.
+    """
+    contribution = 0
+    interest = 0
+    for row in monthly_rows:
+        contribution += row["contribution"]
+        interest += row["interest"]
+        if row["period"] % 12 == 0:
+            yield {
+                "period": row["period"] // 12,
+                "contribution": contribution,
+                "interest": interest,
+                "balance": row["balance"],
+            }
+            contribution = 0
+            interest = 0
+
+def format_schedule_row(row):
+    """
+    Rounds a schedule row's money columns to cents for export.
+
+    Returns:
+        dict: A copy of the row with contribution, interest and balance rounded.
+    """
+    formatted_row = dict(row)
+    for column in ("contribution", "interest", "balance"):
+        formatted_row[column] = round(row[column], 2)
+    return formatted_row
+
+def write_schedule_csv(file, rows, columns=SCHEDULE_COLUMNS, header=True):
+    """
+    Writes schedule rows to an open text file as CSV, one row at a time.
+
+    Args:
+        file: A text file opened with newline="".
+        rows: Schedule rows (dictionaries).
+        columns (list): The columns to write, in order.
+        header (bool): Whether to write the column headings first.
+
+    Returns:
+        int: The number of rows written.
+    """
+    writer = csv.DictWriter(file, fieldnames=columns, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    row_count = 0
+    for row in rows:
+        writer.writerow(format_schedule_row(row))
+        row_count += 1
+    return row_count
+
+def write_schedule_jsonl(file, rows):
+    """
+    Writes schedule rows to an open text file as JSON Lines (one JSON
+    object per line), one row at a time.
+
+    Returns:
+        int: The number of rows written.
+    """
+    row_count = 0
+    for row in rows:
+        file.write(json.dumps(format_schedule_row(row)) + "\n")
+        row_count += 1
+    return row_count
+
+def export_client_schedules(filename, clients, file_format="csv", yearly=False,
+                            round_interest=False):
+    """
+    Streams the schedules of many clients into one CSV or JSON Lines file.
+    Each client's rows are generated while they are written, so memory use
+    doesn't grow with the number of clients or the length of the schedules.
+
+    Args:
+        filename (str): The file to create.
+        clients: Dictionaries with "client_id", "monthly_investment",
+            "yearly_interest_rate" and "years" keys.
+        file_format (str): "csv" or "jsonl".
+        yearly (bool): Write one row per year instead of one per month.
+        round_interest (bool): Round each month's interest to cents.
+
+    Returns:
+        int: The number of rows written.
+    """
+    if file_format not in ("csv", "jsonl"):
+        raise ValueError(f"Unknown export format: {file_format}")
+
+    row_count = 0
+    with open(filename, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as file:
+        header = True
+        for client in clients:
+            rows = monthly_schedule(client["monthly_investment"],
+                                    client["yearly_interest_rate"],
+                                    client["years"], round_interest)
+            if yearly:
+                rows = yearly_schedule(rows)
+            # Tag every row with its client as it passes through
+            rows = (dict(row, client_id=client["client_id"]) for row in rows)
+            if file_format == "csv":
+                row_count += write_schedule_csv(file, rows, ["client_id"] + SCHEDULE_COLUMNS,
+                                                header)
+                header = False
+            else:
+                row_count += write_schedule_jsonl(file, rows)
+    return row_count
+
+def future_value_factors(yearly_interest_rates, years_list):
+    """
+    Calculates the future value of investing 1 each month for every
+    rate and number of years.
+
+    Args:
+        yearly_interest_rates (list): Yearly rates as percents.
+        years_list (list): Numbers of years.
+
+    Returns:
+        A 2D NumPy array, or a list of lists without NumPy, indexed as
+        [rate index][years index].
+    """
+    if np is not None:
+        monthly_rates = np.asarray(yearly_interest_rates, dtype=float)[:, None] / 12 / 100
+        months = np.asarray(years_list, dtype=float)[None, :] * 12
+        growth = (1 + monthly_rates) ** months
+        # Where the rate is 0 the formula divides by 0; the factor is the month count
+        safe_rates = np.where(monthly_rates == 0, 1, monthly_rates)
+        factors = (growth - 1) / safe_rates * (1 + monthly_rates)
+        factors = np.where(monthly_rates == 0, months, factors)
+        return np.where(months > 0, factors, 0)
+    return [[future_value(1, rate, years) for years in years_list]
+            for rate in yearly_interest_rates]
+
+def iter_future_value_grid(monthly_investments, yearly_interest_rates, years_list,
+                           chunk_rows=GRID_CHUNK_ROWS):
+    """
+    Generator that calculates every combination of the inputs in chunks,
+    so huge grids never have to fit in memory at once.
+
+    Args:
+        monthly_investments (list): Monthly investment amounts.
+        yearly_interest_rates (list): Yearly rates as percents.
+        years_list (list): Numbers of years.
+        chunk_rows (int): Approximate number of rows per chunk.
+
+    Yields:
+        A chunk of rows (monthly_investment, yearly_interest_rate, years,
+        future_value): a 2D NumPy array, or a list of tuples without NumPy.
+    """
+    factors = future_value_factors(yearly_interest_rates, years_list)
+    rows_per_investment = len(yearly_interest_rates) * len(years_list)
+    if rows_per_investment == 0:
+        return
+    investments_per_chunk = max(1, chunk_rows // rows_per_investment)
+
+    if np is not None:
+        rates = np.asarray(yearly_interest_rates, dtype=float)
+        years = np.asarray(years_list, dtype=float)
+        rate_column = np.repeat(rates, len(years))
+        years_column = np.tile(years, len(rates))
+        factor_column = factors.ravel()
+        investments = np.asarray(monthly_investments, dtype=float)
+        for start in range(0, len(investments), investments_per_chunk):
+            chunk = investments[start:start + investments_per_chunk]
+            count = len(chunk)
+            yield np.column_stack((
+                np.repeat(chunk, rows_per_investment),
+                np.tile(rate_column, count),
+                np.tile(years_column, count),
+                np.outer(chunk, factor_column).ravel(),
+            ))
+        return
+
+    # Pair each factor with its rate and years once, then reuse the pairs
+    rate_years_factors = [(rate, years, factors[i][j])
+                          for i, rate in enumerate(yearly_interest_rates)
+                          for j, years in enumerate(years_list)]
+    for start in range(0, len(monthly_investments), investments_per_chunk):
+        yield [(investment, rate, years, investment * factor)
+               for investment in monthly_investments[start:start + investments_per_chunk]
+               for rate, years, factor in rate_years_factors]
+
+def future_value_grid(monthly_investments, yearly_interest_rates, years_list):
+    """
+    Calculates every combination of the inputs as one table.
+    Use iter_future_value_grid() or write_future_value_grid_csv() for grids
+    too large to hold in memory.
+
+    Returns:
+        A 2D NumPy array, or a list of tuples without NumPy, with the
+        columns in GRID_COLUMNS.
+    """
+    chunks = list(iter_future_value_grid(monthly_investments, yearly_interest_rates,
+                                         years_list))
+    if np is not None:
+        return np.concatenate(chunks) if chunks else np.empty((0, len(GRID_COLUMNS)))
+    return [row for chunk in chunks for row in chunk]
+
+def write_future_value_grid_csv(filename, monthly_investments, yearly_interest_rates,
+                                years_list, chunk_rows=GRID_CHUNK_ROWS):
+    """
+    Writes every combination of the inputs to a CSV file, one chunk at a time.
+
+    Returns:
+        int: The number of rows written (not counting the header).
+    """
+    row_count = 0
+    with open(filename, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(GRID_COLUMNS)
+        for chunk in iter_future_value_grid(monthly_investments, yearly_interest_rates,
+                                            years_list, chunk_rows):
+            if np is not None:
+                chunk = chunk.tolist()
+            writer.writerows(chunk)
+            row_count += len(chunk)
+    return row_count
+
+def benchmark_grid(monthly_investments, yearly_interest_rates, years_list):
+    """
+    Times the grid calculation against calling future_value() (the scalar
+    path used by Investment.calculateFutureValue) for every scenario.
+
+    Returns:
+        dict: The scenario count and the seconds taken by each path.
+    """
+    start_time = time.perf_counter()
+    for investment in monthly_investments:
+        for rate in yearly_interest_rates:
+            for years in years_list:
+                future_value(investment, rate, years)
+    scalar_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for chunk in iter_future_value_grid(monthly_investments, yearly_interest_rates,
+                                        years_list):
+        pass
+    grid_seconds = time.perf_counter() - start_time
+
+    return {
+        "scenarios": len(monthly_investments) * len(yearly_interest_rates) * len(years_list),
+        "scalar_seconds": scalar_seconds,
+        "grid_seconds": grid_seconds,
+    }
+
+def main():
+    """
+    Benchmarks a 1,000 x 100 x 50 scenario grid.
+    """
+    monthly_investments = [50 + 10 * i for i in range(1000)]
+    yearly_interest_rates = [0.15 * i for i in range(1, 101)]
+    years_list = list(range(1, 51))
+
+    backend = "NumPy" if np is not None else "pure Python"
+    print(f"Benchmarking a future value grid with {backend}...")
+    results = benchmark_grid(monthly_investments, yearly_interest_rates, years_list)
+    print(f"Scenarios:   {results['scenarios']:,}")
+    print(f"Scalar path: {results['scalar_seconds']:.2f} seconds")
+    print(f"Grid path:   {results['grid_seconds']:.2f} seconds")
+    print(f"Speedup:     {results['scalar_seconds'] / results['grid_seconds']:.1f}x")
+
+if __name__ == "__main__":
+    main()